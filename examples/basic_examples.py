@@ -6,125 +6,137 @@ into a JSON Schema.
 """
 
 import json
-import sys
 import os
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
 from jsonldframe2schema import frame_to_schema
 
 
+def _show(obj):
+    """Pretty-print a JSON value, unless JLF2S_QUIET is set (e.g. for timing runs)."""
+    if os.environ.get("JLF2S_QUIET"):
+        return
+    print(json.dumps(obj, indent=2))
+
+
+BASIC_PERSON_FRAME = {
+    "@context": {
+        "xsd": "http://www.w3.org/2001/XMLSchema#",
+        "name": "http://schema.org/name",
+        "age": {"@id": "http://schema.org/age", "@type": "xsd:integer"},
+    },
+    "@type": "Person",
+    "name": {},
+    "age": {},
+}
+
+
 def example_basic_person():
     """Convert a basic Person frame to schema."""
     print("=" * 70)
     print("Example 1: Basic Person Frame")
     print("=" * 70)
 
-    frame = {
-        "@context": {
-            "xsd": "http://www.w3.org/2001/XMLSchema#",
-            "name": "http://schema.org/name",
-            "age": {"@id": "http://schema.org/age", "@type": "xsd:integer"},
-        },
-        "@type": "Person",
-        "name": {},
-        "age": {},
-    }
-
     print("\nInput Frame:")
-    print(json.dumps(frame, indent=2))
+    _show(BASIC_PERSON_FRAME)
 
-    schema = frame_to_schema(frame)
+    schema = frame_to_schema(BASIC_PERSON_FRAME)
 
     print("\nGenerated Schema:")
-    print(json.dumps(schema, indent=2))
+    _show(schema)
     print()
 
 
+NESTED_ADDRESS_FRAME = {
+    "@type": "Person",
+    "@explicit": True,
+    "name": {},
+    "address": {
+        "@type": "PostalAddress",
+        "streetAddress": {},
+        "addressLocality": {},
+        "postalCode": {},
+    },
+}
+
+
 def example_nested_address():
     """Convert a Person frame with nested address to schema."""
     print("=" * 70)
     print("Example 2: Person with Nested Address")
     print("=" * 70)
 
-    frame = {
-        "@type": "Person",
-        "@explicit": True,
-        "name": {},
-        "address": {
-            "@type": "PostalAddress",
-            "streetAddress": {},
-            "addressLocality": {},
-            "postalCode": {},
-        },
-    }
-
     print("\nInput Frame:")
-    print(json.dumps(frame, indent=2))
+    _show(NESTED_ADDRESS_FRAME)
 
-    schema = frame_to_schema(frame)
+    schema = frame_to_schema(NESTED_ADDRESS_FRAME)
 
     print("\nGenerated Schema:")
-    print(json.dumps(schema, indent=2))
+    _show(schema)
     print()
 
 
+ARRAY_PROPERTIES_FRAME = {
+    "@type": "Person",
+    "name": {},
+    "knows": [{"@type": "Person", "name": {}}],
+}
+
+
 def example_array_properties():
     """Convert a frame with array properties to schema."""
     print("=" * 70)
     print("Example 3: Person with Array of Friends")
     print("=" * 70)
 
-    frame = {"@type": "Person", "name": {}, "knows": [{"@type": "Person", "name": {}}]}
-
     print("\nInput Frame:")
-    print(json.dumps(frame, indent=2))
+    _show(ARRAY_PROPERTIES_FRAME)
 
-    schema = frame_to_schema(frame)
+    schema = frame_to_schema(ARRAY_PROPERTIES_FRAME)
 
     print("\nGenerated Schema:")
-    print(json.dumps(schema, indent=2))
+    _show(schema)
     print()
 
 
+NON_EMBEDDED_REFERENCE_FRAME = {
+    "@type": "Article",
+    "title": {},
+    "author": {"@embed": False, "@type": "Person"},
+}
+
+
 def example_non_embedded_reference():
     """Convert a frame with non-embedded references to schema."""
     print("=" * 70)
     print("Example 4: Non-Embedded Reference")
     print("=" * 70)
 
-    frame = {
-        "@type": "Article",
-        "title": {},
-        "author": {"@embed": False, "@type": "Person"},
-    }
-
     print("\nInput Frame:")
-    print(json.dumps(frame, indent=2))
+    _show(NON_EMBEDDED_REFERENCE_FRAME)
 
-    schema = frame_to_schema(frame)
+    schema = frame_to_schema(NON_EMBEDDED_REFERENCE_FRAME)
 
     print("\nGenerated Schema:")
-    print(json.dumps(schema, indent=2))
+    _show(schema)
     print()
 
 
+MULTIPLE_TYPES_FRAME = {"@type": ["Person", "Organization"], "name": {}, "@id": {}}
+
+
 def example_multiple_types():
     """Convert a frame with multiple type options to schema."""
     print("=" * 70)
     print("Example 5: Multiple Type Options")
     print("=" * 70)
 
-    frame = {"@type": ["Person", "Organization"], "name": {}, "@id": {}}
-
     print("\nInput Frame:")
-    print(json.dumps(frame, indent=2))
+    _show(MULTIPLE_TYPES_FRAME)
 
-    schema = frame_to_schema(frame)
+    schema = frame_to_schema(MULTIPLE_TYPES_FRAME)
 
     print("\nGenerated Schema:")
-    print(json.dumps(schema, indent=2))
+    _show(schema)
     print()
 
 
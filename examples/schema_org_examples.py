@@ -6,172 +6,179 @@ vocabulary types into JSON Schemas.
 """
 
 import json
-import sys
 import os
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
 from jsonldframe2schema import frame_to_schema
 
 
+def _show(obj):
+    """Pretty-print a JSON value, unless JLF2S_QUIET is set (e.g. for timing runs)."""
+    if os.environ.get("JLF2S_QUIET"):
+        return
+    print(json.dumps(obj, indent=2))
+
+
+PERSON_FRAME = {
+    "@context": {
+        "xsd": "http://www.w3.org/2001/XMLSchema#",
+        "@vocab": "http://schema.org/",
+        "birthDate": {"@id": "http://schema.org/birthDate", "@type": "xsd:date"},
+        "age": {"@id": "http://schema.org/age", "@type": "xsd:integer"},
+    },
+    "@type": "Person",
+    "@id": {},
+    "name": {},
+    "email": {},
+    "birthDate": {},
+    "address": {
+        "@type": "PostalAddress",
+        "streetAddress": {},
+        "addressLocality": {},
+        "addressRegion": {},
+        "postalCode": {},
+        "addressCountry": {},
+    },
+}
+
+
 def schema_org_person():
     """Schema.org Person frame to schema."""
     print("=" * 70)
     print("Schema.org Person Example")
     print("=" * 70)
 
-    frame = {
-        "@context": {
-            "xsd": "http://www.w3.org/2001/XMLSchema#",
-            "@vocab": "http://schema.org/",
-            "birthDate": {"@id": "http://schema.org/birthDate", "@type": "xsd:date"},
-            "age": {"@id": "http://schema.org/age", "@type": "xsd:integer"},
-        },
-        "@type": "Person",
-        "@id": {},
-        "name": {},
-        "email": {},
-        "birthDate": {},
-        "address": {
-            "@type": "PostalAddress",
-            "streetAddress": {},
-            "addressLocality": {},
-            "addressRegion": {},
-            "postalCode": {},
-            "addressCountry": {},
-        },
-    }
-
     print("\nInput Frame:")
-    print(json.dumps(frame, indent=2))
+    _show(PERSON_FRAME)
 
-    schema = frame_to_schema(frame)
+    schema = frame_to_schema(PERSON_FRAME)
 
     print("\nGenerated Schema:")
-    print(json.dumps(schema, indent=2))
+    _show(schema)
     print()
 
 
+ORGANIZATION_FRAME = {
+    "@context": {
+        "xsd": "http://www.w3.org/2001/XMLSchema#",
+        "@vocab": "http://schema.org/",
+        "foundingDate": {
+            "@id": "http://schema.org/foundingDate",
+            "@type": "xsd:date",
+        },
+    },
+    "@type": "Organization",
+    "@id": {},
+    "name": {},
+    "url": {},
+    "logo": {},
+    "foundingDate": {},
+    "address": {
+        "@type": "PostalAddress",
+        "streetAddress": {},
+        "addressLocality": {},
+        "addressCountry": {},
+    },
+    "member": [{"@type": "Person", "name": {}, "jobTitle": {}}],
+}
+
+
 def schema_org_organization():
     """Schema.org Organization frame to schema."""
     print("=" * 70)
     print("Schema.org Organization Example")
     print("=" * 70)
 
-    frame = {
-        "@context": {
-            "xsd": "http://www.w3.org/2001/XMLSchema#",
-            "@vocab": "http://schema.org/",
-            "foundingDate": {
-                "@id": "http://schema.org/foundingDate",
-                "@type": "xsd:date",
-            },
-        },
-        "@type": "Organization",
-        "@id": {},
-        "name": {},
-        "url": {},
-        "logo": {},
-        "foundingDate": {},
-        "address": {
-            "@type": "PostalAddress",
-            "streetAddress": {},
-            "addressLocality": {},
-            "addressCountry": {},
-        },
-        "member": [{"@type": "Person", "name": {}, "jobTitle": {}}],
-    }
-
     print("\nInput Frame:")
-    print(json.dumps(frame, indent=2))
+    _show(ORGANIZATION_FRAME)
 
-    schema = frame_to_schema(frame)
+    schema = frame_to_schema(ORGANIZATION_FRAME)
 
     print("\nGenerated Schema:")
-    print(json.dumps(schema, indent=2))
+    _show(schema)
     print()
 
 
+ARTICLE_FRAME = {
+    "@context": {
+        "xsd": "http://www.w3.org/2001/XMLSchema#",
+        "@vocab": "http://schema.org/",
+        "datePublished": {
+            "@id": "http://schema.org/datePublished",
+            "@type": "xsd:dateTime",
+        },
+        "wordCount": {"@id": "http://schema.org/wordCount", "@type": "xsd:integer"},
+    },
+    "@type": "Article",
+    "@explicit": True,
+    "@id": {},
+    "headline": {},
+    "alternativeHeadline": {},
+    "author": {"@embed": False, "@type": "Person"},
+    "publisher": {"@embed": False, "@type": "Organization"},
+    "datePublished": {},
+    "wordCount": {},
+}
+
+
 def schema_org_article():
     """Schema.org Article with non-embedded author."""
     print("=" * 70)
     print("Schema.org Article Example (with references)")
     print("=" * 70)
 
-    frame = {
-        "@context": {
-            "xsd": "http://www.w3.org/2001/XMLSchema#",
-            "@vocab": "http://schema.org/",
-            "datePublished": {
-                "@id": "http://schema.org/datePublished",
-                "@type": "xsd:dateTime",
-            },
-            "wordCount": {"@id": "http://schema.org/wordCount", "@type": "xsd:integer"},
-        },
-        "@type": "Article",
-        "@explicit": True,
-        "@id": {},
-        "headline": {},
-        "alternativeHeadline": {},
-        "author": {"@embed": False, "@type": "Person"},
-        "publisher": {"@embed": False, "@type": "Organization"},
-        "datePublished": {},
-        "wordCount": {},
-    }
-
     print("\nInput Frame:")
-    print(json.dumps(frame, indent=2))
+    _show(ARTICLE_FRAME)
 
-    schema = frame_to_schema(frame)
+    schema = frame_to_schema(ARTICLE_FRAME)
 
     print("\nGenerated Schema:")
-    print(json.dumps(schema, indent=2))
+    _show(schema)
     print()
 
 
+EVENT_FRAME = {
+    "@context": {
+        "xsd": "http://www.w3.org/2001/XMLSchema#",
+        "@vocab": "http://schema.org/",
+        "startDate": {
+            "@id": "http://schema.org/startDate",
+            "@type": "xsd:dateTime",
+        },
+        "endDate": {"@id": "http://schema.org/endDate", "@type": "xsd:dateTime"},
+    },
+    "@type": "Event",
+    "@id": {},
+    "name": {},
+    "description": {},
+    "startDate": {},
+    "endDate": {},
+    "location": {
+        "@type": ["Place", "VirtualLocation"],
+        "name": {},
+        "address": {
+            "@type": "PostalAddress",
+            "streetAddress": {},
+            "addressLocality": {},
+        },
+    },
+    "organizer": {"@type": ["Person", "Organization"], "name": {}},
+    "performer": [{"@type": ["Person", "PerformingGroup"], "name": {}}],
+}
+
+
 def schema_org_event():
     """Schema.org Event with complex structure."""
     print("=" * 70)
     print("Schema.org Event Example")
     print("=" * 70)
 
-    frame = {
-        "@context": {
-            "xsd": "http://www.w3.org/2001/XMLSchema#",
-            "@vocab": "http://schema.org/",
-            "startDate": {
-                "@id": "http://schema.org/startDate",
-                "@type": "xsd:dateTime",
-            },
-            "endDate": {"@id": "http://schema.org/endDate", "@type": "xsd:dateTime"},
-        },
-        "@type": "Event",
-        "@id": {},
-        "name": {},
-        "description": {},
-        "startDate": {},
-        "endDate": {},
-        "location": {
-            "@type": ["Place", "VirtualLocation"],
-            "name": {},
-            "address": {
-                "@type": "PostalAddress",
-                "streetAddress": {},
-                "addressLocality": {},
-            },
-        },
-        "organizer": {"@type": ["Person", "Organization"], "name": {}},
-        "performer": [{"@type": ["Person", "PerformingGroup"], "name": {}}],
-    }
-
     print("\nInput Frame:")
-    print(json.dumps(frame, indent=2))
+    _show(EVENT_FRAME)
 
-    schema = frame_to_schema(frame)
+    schema = frame_to_schema(EVENT_FRAME)
 
     print("\nGenerated Schema:")
-    print(json.dumps(schema, indent=2))
+    _show(schema)
     print()
 
 
@@ -6,41 +6,46 @@ JSON-LD documents that have been framed.
 """
 
 import json
-import sys
 import os
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
 from jsonldframe2schema import frame_to_schema
-from jsonschema import validate, ValidationError
+
+
+def _show(obj):
+    """Pretty-print a JSON value, unless JLF2S_QUIET is set (e.g. for timing runs)."""
+    if os.environ.get("JLF2S_QUIET"):
+        return
+    print(json.dumps(obj, indent=2))
+
+
+PERSON_FRAME = {
+    "@context": {
+        "xsd": "http://www.w3.org/2001/XMLSchema#",
+        "name": "http://schema.org/name",
+        "email": "http://schema.org/email",
+        "age": {"@id": "http://schema.org/age", "@type": "xsd:integer"},
+    },
+    "@type": "Person",
+    "name": {},
+    "email": {},
+    "age": {},
+}
 
 
 def validate_person_document():
     """Example: Validate a person document against generated schema."""
+    from jsonschema import Draft202012Validator, ValidationError
+
     print("=" * 70)
     print("Validation Example: Person Document")
     print("=" * 70)
 
-    # Define frame
-    frame = {
-        "@context": {
-            "xsd": "http://www.w3.org/2001/XMLSchema#",
-            "name": "http://schema.org/name",
-            "email": "http://schema.org/email",
-            "age": {"@id": "http://schema.org/age", "@type": "xsd:integer"},
-        },
-        "@type": "Person",
-        "name": {},
-        "email": {},
-        "age": {},
-    }
-
     # Generate schema
-    schema = frame_to_schema(frame)
+    schema = frame_to_schema(PERSON_FRAME)
+    validator = Draft202012Validator(schema)
 
     print("\nGenerated Schema:")
-    print(json.dumps(schema, indent=2))
+    _show(schema)
 
     # Valid document
     valid_doc = {
@@ -51,13 +56,13 @@ def validate_person_document():
     }
 
     print("\n--- Validating Valid Document ---")
-    print(json.dumps(valid_doc, indent=2))
+    _show(valid_doc)
 
     try:
-        validate(instance=valid_doc, schema=schema)
+        validator.validate(valid_doc)
         print("✓ Validation passed!")
     except ValidationError as e:
-        print(f"✗ Validation failed: {str(e).split("\n")[0]}")
+        print(f"✗ Validation failed: {e.message}")
 
     # Invalid document - missing required field
     invalid_doc_1 = {
@@ -67,13 +72,13 @@ def validate_person_document():
     }
 
     print("\n--- Validating Invalid Document (missing fields) ---")
-    print(json.dumps(invalid_doc_1, indent=2))
+    _show(invalid_doc_1)
 
     try:
-        validate(instance=invalid_doc_1, schema=schema)
+        validator.validate(invalid_doc_1)
         print("✓ Validation passed!")
     except ValidationError as e:
-        print(f"✗ Validation failed: {str(e).split("\n")[0]}")
+        print(f"✗ Validation failed: {e.message}")
 
     # Invalid document - wrong type for age
     invalid_doc_2 = {
@@ -84,42 +89,46 @@ def validate_person_document():
     }
 
     print("\n--- Validating Invalid Document (wrong type) ---")
-    print(json.dumps(invalid_doc_2, indent=2))
+    _show(invalid_doc_2)
 
     try:
-        validate(instance=invalid_doc_2, schema=schema)
+        validator.validate(invalid_doc_2)
         print("✓ Validation passed!")
     except ValidationError as e:
-        print(f"✗ Validation failed: {str(e).split("\n")[0]}")
+        print(f"✗ Validation failed: {e.message}")
 
     print()
 
 
+# Frame with @explicit: true
+EXPLICIT_FRAME = {"@type": "Product", "@explicit": True, "name": {}, "price": {}}
+
+
 def validate_explicit_frame():
     """Example: Validate with explicit flag."""
+    from jsonschema import Draft202012Validator, ValidationError
+
     print("=" * 70)
     print("Validation Example: Explicit Frame")
     print("=" * 70)
 
-    # Frame with @explicit: true
-    frame = {"@type": "Product", "@explicit": True, "name": {}, "price": {}}
-
-    schema = frame_to_schema(frame)
+    schema = frame_to_schema(EXPLICIT_FRAME)
+    validator = Draft202012Validator(schema)
 
     print("\nGenerated Schema (with @explicit: true):")
-    print(json.dumps(schema, indent=2))
+    _show(schema)
 
     # Valid document - only specified properties
     valid_doc = {"@type": "Product", "name": "Laptop", "price": 999.99}
 
     print("\n--- Validating Valid Document ---")
-    print(json.dumps(valid_doc, indent=2))
+    _show(valid_doc)
 
     try:
-        validate(instance=valid_doc, schema=schema)
+        validator.validate(valid_doc)
         print("✓ Validation passed!")
     except ValidationError as e:
-        print(f"✗ Validation failed: {str(e).split("\n")[0]}")
+        print(f"✗ Validation failed: {e.message}")
 
     # Invalid document - additional property
     invalid_doc = {
@@ -130,33 +139,37 @@ def validate_explicit_frame():
     }
 
     print("\n--- Validating Invalid Document (extra property) ---")
-    print(json.dumps(invalid_doc, indent=2))
+    _show(invalid_doc)
 
     try:
-        validate(instance=invalid_doc, schema=schema)
+        validator.validate(invalid_doc)
         print("✓ Validation passed!")
     except ValidationError as e:
-        print(f"✗ Validation failed: {str(e).split("\n")[0]}")
+        print(f"✗ Validation failed: {e.message}")
 
     print()
 
 
+NESTED_OBJECTS_FRAME = {
+    "@type": "Person",
+    "name": {},
+    "worksFor": {"@type": "Organization", "name": {}, "url": {}},
+}
+
+
 def validate_nested_objects():
     """Example: Validate nested objects."""
+    from jsonschema import Draft202012Validator, ValidationError
+
     print("=" * 70)
     print("Validation Example: Nested Objects")
     print("=" * 70)
 
-    frame = {
-        "@type": "Person",
-        "name": {},
-        "worksFor": {"@type": "Organization", "name": {}, "url": {}},
-    }
-
-    schema = frame_to_schema(frame)
+    schema = frame_to_schema(NESTED_OBJECTS_FRAME)
+    validator = Draft202012Validator(schema)
 
     print("\nGenerated Schema:")
-    print(json.dumps(schema, indent=2))
+    _show(schema)
 
     # Valid nested document
     valid_doc = {
@@ -170,13 +183,13 @@ def validate_nested_objects():
     }
 
     print("\n--- Validating Valid Nested Document ---")
-    print(json.dumps(valid_doc, indent=2))
+    _show(valid_doc)
 
     try:
-        validate(instance=valid_doc, schema=schema)
+        validator.validate(valid_doc)
         print("✓ Validation passed!")
     except ValidationError as e:
-        print(f"✗ Validation failed: {str(e).split("\n")[0]}")
+        print(f"✗ Validation failed: {e.message}")
 
     # Invalid - missing nested property
     invalid_doc = {
@@ -190,29 +203,37 @@ def validate_nested_objects():
     }
 
     print("\n--- Validating Invalid Document (missing nested property) ---")
-    print(json.dumps(invalid_doc, indent=2))
+    _show(invalid_doc)
 
     try:
-        validate(instance=invalid_doc, schema=schema)
+        validator.validate(invalid_doc)
         print("✓ Validation passed!")
     except ValidationError as e:
-        print(f"✗ Validation failed: {str(e).split("\n")[0]}")
+        print(f"✗ Validation failed: {e.message}")
 
     print()
 
 
+ARRAY_FRAME = {
+    "@type": "Person",
+    "name": {},
+    "knows": [{"@type": "Person", "name": {}}],
+}
+
+
 def validate_arrays():
     """Example: Validate array properties."""
+    from jsonschema import Draft202012Validator, ValidationError
+
     print("=" * 70)
     print("Validation Example: Array Properties")
     print("=" * 70)
 
-    frame = {"@type": "Person", "name": {}, "knows": [{"@type": "Person", "name": {}}]}
-
-    schema = frame_to_schema(frame)
+    schema = frame_to_schema(ARRAY_FRAME)
+    validator = Draft202012Validator(schema)
 
     print("\nGenerated Schema:")
-    print(json.dumps(schema, indent=2))
+    _show(schema)
 
     # Valid document with array
     valid_doc = {
@@ -225,13 +246,13 @@ def validate_arrays():
     }
 
     print("\n--- Validating Valid Document with Array ---")
-    print(json.dumps(valid_doc, indent=2))
+    _show(valid_doc)
 
     try:
-        validate(instance=valid_doc, schema=schema)
+        validator.validate(valid_doc)
         print("✓ Validation passed!")
     except ValidationError as e:
-        print(f"✗ Validation failed: {str(e).split("\n")[0]}")
+        print(f"✗ Validation failed: {e.message}")
 
     # Invalid - array item missing property
     invalid_doc = {
@@ -244,13 +265,13 @@ def validate_arrays():
     }
 
     print("\n--- Validating Invalid Document (array item missing property) ---")
-    print(json.dumps(invalid_doc, indent=2))
+    _show(invalid_doc)
 
     try:
-        validate(instance=invalid_doc, schema=schema)
+        validator.validate(invalid_doc)
         print("✓ Validation passed!")
     except ValidationError as e:
-        print(f"✗ Validation failed: {str(e).split("\n")[0]}")
+        print(f"✗ Validation failed: {e.message}")
 
     print()
 
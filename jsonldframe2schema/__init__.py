@@ -8,7 +8,18 @@ JSON Schema documents for validation purposes.
 __version__ = "0.1.0"
 __author__ = "Jesse Wright"
 
-from .converter import FrameToSchemaConverter, frame_to_schema
+from .converter import (
+    DEFAULT_SCHEMA_VERSION,
+    FrameToSchemaConverter,
+    frame_to_schema,
+    frame_to_schema_cached,
+)
 from .cli import main as cli_main
 
-__all__ = ["FrameToSchemaConverter", "frame_to_schema", "cli_main"]
+__all__ = [
+    "DEFAULT_SCHEMA_VERSION",
+    "FrameToSchemaConverter",
+    "frame_to_schema",
+    "frame_to_schema_cached",
+    "cli_main",
+]
@@ -4,7 +4,10 @@ Main entry point for running jsonldframe2schema as a module.
 Usage: python -m jsonldframe2schema [options]
 """
 
-from .cli import main
+import sys
+
+from .cli import configure_logging, main
 
 if __name__ == "__main__":
-    main()
+    configure_logging()
+    sys.exit(main())
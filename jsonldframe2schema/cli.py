@@ -5,25 +5,168 @@ Command-line interface for jsonldframe2schema.
 Usage:
     python -m jsonldframe2schema.cli <input_frame.json> [output_schema.json]
     cat frame.json | python -m jsonldframe2schema.cli
+    python -m jsonldframe2schema.cli --batch <frames_dir> <schemas_dir>
 """
 
 import sys
 import json
+import logging
 import argparse
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, TextIO, Union
 
-from .converter import frame_to_schema
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
 
+from .converter import DEFAULT_SCHEMA_VERSION, frame_to_schema_cached
 
-def main(argv: Optional[list] = None) -> int:
+logger = logging.getLogger(__name__)
+
+# Write buffer size (in bytes) for output files, so large schemas need few syscalls
+_OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Range of integers orjson can serialize (signed and unsigned 64-bit)
+_ORJSON_MIN_INT = -(1 << 63)
+_ORJSON_MAX_INT = (1 << 64) - 1
+
+
+def _loads(data: Union[bytes, str]) -> Any:
     """
-    Main CLI entry point.
+    Parse JSON with the standard library.
+
+    orjson is not used for input: it reads integers beyond 64 bits as lossy
+    floats and rejects the NaN and Infinity literals that json accepts, which
+    would change the generated schema.
+    """
+    return json.loads(data)
+
+
+def _load_file(path: str) -> Any:
+    """Parse a JSON file, reading it as bytes to skip the text decoding pass."""
+    with open(path, "rb") as f:
+        return _loads(f.read())
+
+
+def _orjson_compatible(value: Any) -> bool:
+    """
+    Check that orjson encodes a value exactly as json.dumps does.
+
+    That holds for dicts with string keys, lists, strings, booleans, None and
+    integers within 64 bits. Floats are excluded because the two encoders
+    format them differently (1e16 against 1e+16, and NaN).
+    """
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            for key in item:
+                if not isinstance(key, str):
+                    return False
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+        elif isinstance(item, int):
+            if not _ORJSON_MIN_INT <= item <= _ORJSON_MAX_INT:
+                return False
+        elif item is not None and not isinstance(item, str):
+            return False
+    return True
+
+
+def _dump(schema: Dict[str, Any], stream: TextIO, indent: Optional[int]) -> None:
+    """
+    Write a schema as JSON to a text stream, followed by a newline.
+
+    The output is always that of json.dump with the given indent. With the
+    default two-space indentation, orjson encodes the schema in one fast pass
+    when its output is known to match: the schema holds no floats or integers
+    beyond 64 bits, and the encoded text is ASCII (orjson never escapes
+    non-ASCII characters). Everything else, including other indents and
+    --compact, goes to the stdlib encoder, which writes incrementally to the
+    stream.
+    """
+    if orjson is not None and indent == 2 and _orjson_compatible(schema):
+        try:
+            data = orjson.dumps(schema, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            # e.g. lone surrogates in strings, which json escapes instead
+            data = b""
+        if data and data.isascii():
+            stream.write(data.decode("ascii"))
+            stream.write("\n")
+            return
+    json.dump(schema, stream, indent=indent)
+    stream.write("\n")
+
+
+def _describe_error(e: Exception) -> str:
+    """Format an exception raised while converting a frame for display."""
+    if isinstance(e, FileNotFoundError):
+        return f"File not found: {e.filename}"
+    if isinstance(e, json.JSONDecodeError):
+        return f"Invalid JSON: {e}"
+    return str(e)
+
+
+def _convert_batch(
+    input_dir: Path,
+    output_dir: Path,
+    convert_options: Dict[str, Any],
+    indent: Optional[int],
+) -> List[str]:
+    """
+    Convert every *.json frame in a directory within a single process.
+
+    Each schema is written to output_dir under the same file name as its
+    frame. Files are processed on a thread pool so reads and writes overlap,
+    and repeated frames are served from the conversion cache.
 
     Args:
-        argv: Command-line arguments (default: sys.argv)
+        input_dir: Directory containing JSON-LD Frame files
+        output_dir: Directory to write JSON Schema files to
+        convert_options: Keyword arguments for frame_to_schema_cached
+        indent: JSON indentation, or None for compact output
 
     Returns:
-        Exit code (0 for success, 1 for error)
+        Error messages for frames that could not be converted, or for the
+        output directory if it could not be created
+    """
+    try:
+        output_dir.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        # e.g. the path exists as a file, or its parent is not writable
+        return [f"{output_dir}: {_describe_error(e)}"]
+
+    def convert_one(frame_file: Path) -> Optional[str]:
+        output_file = output_dir / frame_file.name
+        try:
+            frame = _load_file(str(frame_file))
+            schema = frame_to_schema_cached(frame, **convert_options)
+            with open(
+                output_file, "w", encoding="utf-8", buffering=_OUTPUT_BUFFER_SIZE
+            ) as f:
+                _dump(schema, f, indent)
+        except Exception as e:
+            return f"{frame_file}: {_describe_error(e)}"
+        logger.info("Schema written to %s", output_file)
+        return None
+
+    with ThreadPoolExecutor() as executor:
+        results = executor.map(convert_one, sorted(input_dir.glob("*.json")))
+        return [error for error in results if error is not None]
+
+
+@lru_cache(maxsize=None)
+def _get_parser() -> argparse.ArgumentParser:
+    """
+    Build the argument parser, once per process.
+
+    The parser is built on first use rather than at import time so that the
+    program name in usage messages reflects how the CLI was invoked.
     """
     parser = argparse.ArgumentParser(
         description="Convert JSON-LD Frames to JSON Schema",
@@ -38,6 +181,9 @@ Examples:
 
   # Read from stdin and write to stdout
   cat frame.json | %(prog)s
+
+  # Convert every *.json frame in frames/ into schemas/
+  %(prog)s --batch frames/ schemas/
         """,
     )
 
@@ -51,7 +197,7 @@ Examples:
 
     parser.add_argument(
         "--schema-version",
-        default="https://json-schema.org/draft/2020-12/schema",
+        default=DEFAULT_SCHEMA_VERSION,
         help="JSON Schema version URI (default: draft 2020-12)",
     )
 
@@ -69,50 +215,92 @@ Examples:
         help="Output only the schema for @graph items, without @context and @graph wrapper",
     )
 
+    parser.add_argument(
+        "--batch",
+        metavar="DIR",
+        help="Convert every *.json frame in DIR, writing schemas to the directory "
+        "given as the positional argument",
+    )
+
+    return parser
+
+
+def configure_logging() -> None:
+    """Send CLI notices to stderr when running as a program."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stderr)
+
+
+def main(argv: Optional[list] = None) -> int:
+    """
+    Main CLI entry point.
+
+    Args:
+        argv: Command-line arguments (default: sys.argv)
+
+    Returns:
+        Exit code (0 for success, 1 for error)
+    """
+    parser = _get_parser()
     args = parser.parse_args(argv)
 
+    indent = None if args.compact else args.indent
+    convert_options: Dict[str, Any] = {"graph_only": args.graph_only}
+    # Leave the default version to the converter rather than passing it through
+    if args.schema_version != parser.get_default("schema_version"):
+        convert_options["schema_version"] = args.schema_version
+
+    if args.batch:
+        # In batch mode the only positional argument is the output directory
+        if args.input is None or args.output is not None:
+            parser.error("--batch requires exactly one output directory")
+        input_dir = Path(args.batch)
+        output_dir = Path(args.input)
+        if not input_dir.is_dir():
+            print(f"Error: Not a directory: {input_dir}", file=sys.stderr)
+            return 1
+        if output_dir.exists() and output_dir.resolve() == input_dir.resolve():
+            print(
+                "Error: Output directory must differ from the batch directory",
+                file=sys.stderr,
+            )
+            return 1
+
+        errors = _convert_batch(input_dir, output_dir, convert_options, indent)
+        for error in errors:
+            print(f"Error: {error}", file=sys.stderr)
+        return 1 if errors else 0
+
     # Determine output file
     output_file = args.output
 
     try:
         # Read input frame
         if args.input:
-            with open(args.input, "r") as f:
-                frame = json.load(f)
+            frame = _load_file(args.input)
         else:
-            # Read from stdin
-            frame = json.load(sys.stdin)
+            # Read raw bytes from stdin to skip the text decoding layer
+            frame = _loads(sys.stdin.buffer.read())
 
         # Convert to schema
-        schema = frame_to_schema(
-            frame, schema_version=args.schema_version, graph_only=args.graph_only
-        )
-
-        # Format output
-        indent = None if args.compact else args.indent
-        schema_json = json.dumps(schema, indent=indent)
+        schema = frame_to_schema_cached(frame, **convert_options)
 
         # Write output
         if output_file:
-            with open(output_file, "w") as f:
-                f.write(schema_json)
-                f.write("\n")
-            print(f"Schema written to {output_file}", file=sys.stderr)
+            with open(
+                output_file, "w", encoding="utf-8", buffering=_OUTPUT_BUFFER_SIZE
+            ) as f:
+                _dump(schema, f, indent)
+            logger.info("Schema written to %s", output_file)
         else:
-            print(schema_json)
+            _dump(schema, sys.stdout, indent)
 
         return 0
 
-    except FileNotFoundError as e:
-        print(f"Error: File not found: {e.filename}", file=sys.stderr)
-        return 1
-    except json.JSONDecodeError as e:
-        print(f"Error: Invalid JSON: {e}", file=sys.stderr)
-        return 1
     except Exception as e:
-        print(f"Error: {e}", file=sys.stderr)
+        print(f"Error: {_describe_error(e)}", file=sys.stderr)
         return 1
 
 
 if __name__ == "__main__":
+    configure_logging()
     sys.exit(main())
@@ -5,10 +5,111 @@ This module implements the algorithm defined in ALGORITHM.md to convert
 JSON-LD 1.1 Frames into JSON Schema documents.
 """
 
-from typing import Any, Dict, List, Optional, Union
-import copy
+from functools import lru_cache
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+import json
+import sys
 from pyld import jsonld
 
+# JSON Schema version URI used when none is given (interned, as it is compared often)
+DEFAULT_SCHEMA_VERSION = sys.intern("https://json-schema.org/draft/2020-12/schema")
+
+# Context information for a term: its @container keyword and coerced type URI
+_TermInfo = Tuple[Optional[str], Optional[str]]
+
+
+class _FramingFlags(NamedTuple):
+    """Framing flags in effect for a frame object (values as given in the frame)."""
+
+    embed: Any
+    explicit: Any
+    require_all: Any
+    omit_default: Any
+
+
+# Flags for a frame that sets none of them (shared, as flags are immutable)
+_DEFAULT_FRAMING_FLAGS = _FramingFlags(
+    embed=True, explicit=False, require_all=False, omit_default=False
+)
+
+
+# BCP 47 language tags: language[-script][-region][-variant][-extension][-privateuse]
+# This pattern is more permissive to handle common cases
+# Matches: en, en-US, es-419, zh-Hans-CN, etc.
+_LANGUAGE_TAG_PATTERN = (
+    "^[a-z]{2,3}(-[A-Z][a-z]{3})?(-[A-Z]{2}|-[0-9]{3})?(-[a-z0-9]+)*$"
+)
+
+
+def _language_container_schema(
+    item_schema: Dict[str, Any], typed: bool
+) -> Dict[str, Any]:
+    """Language map: allows a plain value or an object keyed by language code."""
+    return {
+        "oneOf": [
+            item_schema,
+            {
+                "type": "object",
+                "patternProperties": {_LANGUAGE_TAG_PATTERN: item_schema},
+                "additionalProperties": False,
+            },
+        ]
+    }
+
+
+def _index_container_schema(item_schema: Dict[str, Any], typed: bool) -> Dict[str, Any]:
+    """Index container: object with arbitrary keys."""
+    return {"type": "object", "additionalProperties": item_schema}
+
+
+def _set_container_schema(item_schema: Dict[str, Any], typed: bool) -> Dict[str, Any]:
+    """Set container: array with unique items, typed only under type coercion."""
+    if typed:
+        return {"type": "array", "uniqueItems": True, "items": item_schema}
+    return {"type": "array", "uniqueItems": True}
+
+
+def _list_container_schema(item_schema: Dict[str, Any], typed: bool) -> Dict[str, Any]:
+    """List container: ordered array, typed only under type coercion."""
+    if typed:
+        return {"type": "array", "items": item_schema}
+    return {"type": "array"}
+
+
+def _is_empty(value: Any) -> bool:
+    """Check if value is an empty dict."""
+    return isinstance(value, dict) and not value
+
+
+def _is_wildcard(value: Any) -> bool:
+    """Check if value is a wildcard (empty dict or array)."""
+    return isinstance(value, (dict, list)) and not value
+
+
+# Schema builders for supported @container values, keyed by container keyword.
+# Each takes the item schema and whether the term has type coercion.
+_CONTAINER_SCHEMA_BUILDERS: Dict[
+    str, Callable[[Dict[str, Any], bool], Dict[str, Any]]
+] = {
+    "@language": _language_container_schema,
+    "@index": _index_container_schema,
+    "@set": _set_container_schema,
+    "@list": _list_container_schema,
+}
+
 
 class FrameToSchemaConverter:
     """
@@ -22,7 +123,8 @@ class FrameToSchemaConverter:
     # Maps expanded type URIs to JSON Schema types
     # Note: Contexts should properly define prefixes (e.g., "xsd": "http://www.w3.org/2001/XMLSchema#")
     # for pyld to expand them correctly
-    TYPE_MAPPINGS = {
+    # Values must stay flat dicts of primitives: they are handed out as shallow copies
+    TYPE_MAPPINGS: ClassVar[Dict[str, Dict[str, str]]] = {
         "@id": {"type": "string", "format": "uri"},
         "http://www.w3.org/2001/XMLSchema#string": {"type": "string"},
         "http://www.w3.org/2001/XMLSchema#integer": {"type": "integer"},
@@ -40,27 +142,41 @@ class FrameToSchemaConverter:
         "http://www.w3.org/2001/XMLSchema#time": {"type": "string", "format": "time"},
     }
 
-    FRAMING_KEYWORDS = {
-        "@context",
-        "@embed",
-        "@explicit",
-        "@requireAll",
-        "@omitDefault",
-        "@graph",
-        "@reverse",
+    # JSON type names for the exact Python types produced by json.loads
+    JSON_TYPE_NAMES: ClassVar[Dict[type, str]] = {
+        bool: "boolean",
+        int: "integer",
+        float: "number",
+        str: "string",
+        list: "array",
+        dict: "object",
+        type(None): "null",
     }
 
-    # Prefix used to mark container types in context map
-    CONTAINER_PREFIX = "@container:"
-    # Separator for encoding both container and type in context map
-    # Note: Using "|" as separator is safe because:
-    # - @container values are keywords (@set, @list, @index, @language) without pipes
-    # - Type URIs in JSON-LD (xsd:*, @id, etc.) do not contain pipe characters
-    CONTEXT_SEPARATOR = "|"
+    FRAMING_KEYWORDS: ClassVar[FrozenSet[str]] = frozenset(
+        {
+            "@context",
+            "@embed",
+            "@explicit",
+            "@requireAll",
+            "@omitDefault",
+            "@graph",
+            "@reverse",
+        }
+    )
+
+    # Framing keywords that set a flag inherited by nested frames
+    FLAG_KEYWORDS: ClassVar[FrozenSet[str]] = frozenset(
+        {"@embed", "@explicit", "@requireAll", "@omitDefault"}
+    )
+
+    # Frame keys that are not turned into regular properties: framing keywords,
+    # plus @type and @id which are handled as constraints of their own
+    NON_PROPERTY_KEYS: ClassVar[FrozenSet[str]] = FRAMING_KEYWORDS | {"@type", "@id"}
 
     def __init__(
         self,
-        schema_version: str = "https://json-schema.org/draft/2020-12/schema",
+        schema_version: str = DEFAULT_SCHEMA_VERSION,
         graph_only: bool = False,
     ):
         """
@@ -88,33 +204,42 @@ class FrameToSchemaConverter:
             initialization, returns only the schema for objects within @graph.
         """
         # Check if frame has @graph - if so, use the content from @graph
+        # (handling both array and single object in @graph)
         frame_content = frame
-        if "@graph" in frame:
-            graph_value = frame["@graph"]
-            # Handle both array and single object in @graph
-            if isinstance(graph_value, list) and len(graph_value) > 0:
-                frame_content = graph_value[0]
-            elif isinstance(graph_value, dict):
-                frame_content = graph_value
-            # Preserve context from outer frame if inner doesn't have one
-            if "@context" not in frame_content and "@context" in frame:
-                frame_content = {"@context": frame["@context"], **frame_content}
-
-        # Build the schema for graph items (the object schema)
-        graph_item_schema: Dict[str, Any] = {"type": "object"}
-
-        # Extract global framing flags
-        flags = self._extract_framing_flags(frame_content)
+        graph_value = frame.get("@graph")
+        if isinstance(graph_value, dict):
+            frame_content = graph_value
+        elif isinstance(graph_value, list) and graph_value:
+            frame_content = graph_value[0]
+
+        # Build the schema for graph items (the object schema). In graph_only
+        # mode it is the whole result, so it starts out with $schema
+        graph_item_schema: Dict[str, Any] = (
+            {"$schema": self.schema_version, "type": "object"}
+            if self.graph_only
+            else {"type": "object"}
+        )
+
+        if frame_content.keys() <= {"@context"}:
+            # Nothing to constrain (e.g. {}): any object matches, so skip
+            # flag and context extraction entirely
+            graph_item_schema["additionalProperties"] = True
+        else:
+            # Extract global framing flags
+            flags = self._extract_framing_flags(frame_content)
 
-        # Extract context for type information
-        context = self._extract_context(frame_content)
+            # Extract context for type information, falling back to the
+            # outer frame's context if the @graph item doesn't have one
+            context = self._extract_context(
+                frame_content if "@context" in frame_content else frame
+            )
 
-        # Process the main frame object
-        self._process_frame_object(frame_content, graph_item_schema, flags, context)
+            # Process the main frame object
+            self._process_frame_object(frame_content, graph_item_schema, flags, context)
 
         # If graph_only mode, return just the item schema with $schema
         if self.graph_only:
-            return {"$schema": self.schema_version, **graph_item_schema}
+            return graph_item_schema
 
         # Build the full document schema with @context and @graph
         schema: Dict[str, Any] = {
@@ -133,7 +258,7 @@ class FrameToSchemaConverter:
 
         return schema
 
-    def _extract_framing_flags(self, frame: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_framing_flags(self, frame: Dict[str, Any]) -> _FramingFlags:
         """
         Extract framing flags from the frame.
 
@@ -141,34 +266,71 @@ class FrameToSchemaConverter:
             frame: JSON-LD Frame object
 
         Returns:
-            Dictionary of framing flags
+            Framing flags
         """
-        return {
-            "embed": frame.get("@embed", True),
-            "explicit": frame.get("@explicit", False),
-            "requireAll": frame.get("@requireAll", False),
-            "omitDefault": frame.get("@omitDefault", False),
-        }
-
-    def _extract_context(self, frame: Dict[str, Any]) -> Dict[str, Optional[str]]:
+        if frame.keys().isdisjoint(self.FLAG_KEYWORDS):
+            return _DEFAULT_FRAMING_FLAGS
+
+        return _FramingFlags(
+            embed=frame.get("@embed", True),
+            explicit=frame.get("@explicit", False),
+            require_all=frame.get("@requireAll", False),
+            omit_default=frame.get("@omitDefault", False),
+        )
+
+    def _extract_context(
+        self, frame: Dict[str, Any]
+    ) -> Mapping[str, Optional[_TermInfo]]:
         """
         Extract type and container information from @context.
 
+        Parsed contexts are cached, so frames sharing a context (e.g. the same
+        schema.org context) only pay for the pyld expansion once.
+
         Args:
             frame: JSON-LD Frame object
 
         Returns:
-            Dictionary mapping property names to their type URIs or container info
+            Read-only mapping of property names to their container and type URI
         """
         context = frame.get("@context")
         if not context:
             return {}
 
-        return self._parse_context(context)
+        try:
+            context_key = json.dumps(context, sort_keys=True)
+        except (TypeError, ValueError):
+            # Not JSON-serializable, so it cannot be used as a cache key
+            return self._parse_context(context)
+
+        return self._parse_context_cached(context_key)
+
+    @classmethod
+    @lru_cache(maxsize=128)
+    def _parse_context_cached(
+        cls, context_key: str
+    ) -> Mapping[str, Optional[_TermInfo]]:
+        """
+        Parse a serialized JSON-LD context, memoizing the result.
+
+        Contexts are keyed by their JSON serialization rather than by object
+        identity, since ids are reused once the original object is freed. The
+        class is part of the key too, so a subclass that overrides the
+        parsing classmethods does not share results with its base class. No
+        instance is needed, so subclass constructors are never called.
+
+        Args:
+            context_key: JSON serialization of the context (with sorted keys)
+
+        Returns:
+            Read-only mapping of property names to their container and type URI
+        """
+        return MappingProxyType(cls._parse_context(json.loads(context_key)))
 
+    @classmethod
     def _parse_context(
-        self, context: Union[str, Dict, List]
-    ) -> Dict[str, Optional[str]]:
+        cls, context: Union[str, Dict, List]
+    ) -> Dict[str, Optional[_TermInfo]]:
         """
         Parse JSON-LD context to extract type coercion and container information.
 
@@ -179,9 +341,9 @@ class FrameToSchemaConverter:
             context: JSON-LD context (string, dict, or list)
 
         Returns:
-            Dictionary mapping property names to their type URIs or container types
+            Dictionary mapping property names to their (container, type URI) pairs
         """
-        type_map: Dict[str, Optional[str]] = {}
+        type_map: Dict[str, Optional[_TermInfo]] = {}
 
         if not context:
             return type_map
@@ -189,71 +351,23 @@ class FrameToSchemaConverter:
         try:
             # Process dictionary contexts
             if isinstance(context, dict):
-                for key, value in context.items():
-                    # Skip JSON-LD keywords
-                    if key.startswith("@"):
-                        continue
-
-                    # Skip simple string mappings (both prefix definitions and simple property URIs)
-                    if isinstance(value, str):
-                        continue
-
-                    # Check if this property definition has @container or @type
-                    if isinstance(value, dict) and (
-                        "@container" in value or "@type" in value
-                    ):
-                        parts = []
-
-                        # Handle @container directive
-                        if "@container" in value:
-                            container_type = value["@container"]
-                            parts.append(f"{self.CONTAINER_PREFIX}{container_type}")
-
-                        # Handle @type coercion
-                        if "@type" in value:
-                            # Use pyld.expand() to resolve the type URI
-                            test_doc = {"@context": context, key: "test_value"}
-                            try:
-                                expanded = jsonld.expand(test_doc)
-                                # Extract type from expanded document
-                                if expanded and len(expanded) > 0:
-                                    for prop_uri, prop_values in expanded[0].items():
-                                        if not prop_uri.startswith("@"):
-                                            if (
-                                                prop_values
-                                                and isinstance(prop_values, list)
-                                                and len(prop_values) > 0
-                                                and isinstance(prop_values[0], dict)
-                                            ):
-                                                type_uri = prop_values[0].get("@type")
-                                                if type_uri:
-                                                    # Validate that type URI doesn't contain separator
-                                                    # (should never happen with valid JSON-LD types)
-                                                    if (
-                                                        self.CONTEXT_SEPARATOR
-                                                        in type_uri
-                                                    ):
-                                                        # Skip this type if it contains separator
-                                                        continue
-                                                    parts.append(type_uri)
-                                                    break
-                            except (jsonld.JsonLdError, ValueError, TypeError):
-                                # If pyld cannot process this property, continue
-                                pass
-
-                        # Store the combined value or set to None if no parts
-                        if parts:
-                            type_map[key] = self.CONTEXT_SEPARATOR.join(parts)
-                        else:
-                            type_map[key] = None
-                    elif isinstance(value, dict):
-                        # Property definition without type coercion or container
-                        type_map[key] = None
-
-            # Process array contexts (recursively)
+                # Resolve the type URIs of all type-coerced terms up front
+                type_uris = cls._expand_term_types(context, cls._typed_terms(context))
+                cls._add_term_info(type_map, context, type_uris)
+
+            # Process array contexts
             elif isinstance(context, list):
+                # Resolve the typed terms of every entry in one expansion of
+                # the whole array, so a term can use a prefix defined in an
+                # earlier entry
+                entries = [ctx for ctx in context if isinstance(ctx, dict)]
+                type_uris = cls._expand_array_term_types(entries)
+                # Entries are merged into one map, later ones overriding
                 for ctx in context:
-                    type_map.update(self._parse_context(ctx))
+                    if isinstance(ctx, dict):
+                        cls._add_term_info(type_map, ctx, type_uris)
+                    elif isinstance(ctx, list):
+                        type_map.update(cls._parse_context(ctx))
 
         except (jsonld.JsonLdError, ValueError, TypeError, KeyError):
             # If context processing fails entirely, return empty type map
@@ -261,12 +375,190 @@ class FrameToSchemaConverter:
 
         return type_map
 
+    @classmethod
+    def _add_term_info(
+        cls,
+        type_map: Dict[str, Optional[_TermInfo]],
+        context: Dict[str, Any],
+        type_uris: Dict[str, str],
+    ) -> None:
+        """
+        Record the container and type of each term defined in a context.
+
+        Args:
+            type_map: Mapping to add the terms to (updated in place)
+            context: JSON-LD context dictionary
+            type_uris: Expanded type URIs of the type-coerced terms
+        """
+        for key, value in context.items():
+            # Skip JSON-LD keywords
+            if key.startswith("@"):
+                continue
+
+            # Skip simple string mappings (both prefix definitions and simple property URIs)
+            if isinstance(value, str):
+                continue
+
+            # Check if this property definition has @container or @type
+            if isinstance(value, dict) and ("@container" in value or "@type" in value):
+                # Handle @container directive (only keywords can be supported)
+                container_type = value.get("@container")
+                if not isinstance(container_type, str):
+                    container_type = None
+
+                # Handle @type coercion (resolved by pyld)
+                type_uri = type_uris.get(key)
+
+                # Store the pair, or None if neither is usable
+                if container_type is None and type_uri is None:
+                    type_map[key] = None
+                else:
+                    type_map[key] = (container_type, type_uri)
+            elif isinstance(value, dict):
+                # Property definition without type coercion or container
+                type_map[key] = None
+
+    @classmethod
+    def _typed_terms(cls, context: Dict[str, Any]) -> List[str]:
+        """
+        List the terms of a context dictionary that have @type coercion.
+
+        Args:
+            context: JSON-LD context dictionary
+
+        Returns:
+            Terms whose definition is an object containing @type
+        """
+        return [
+            key
+            for key, value in context.items()
+            if not key.startswith("@") and isinstance(value, dict) and "@type" in value
+        ]
+
+    @classmethod
+    def _expand_array_term_types(cls, entries: List[Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Resolve the coerced type URIs of the terms of an array context.
+
+        The typed terms of every entry are expanded together against the
+        whole array. If pyld rejects that, each entry is expanded against the
+        entries up to and including it (so earlier prefixes still apply), and
+        failing that on its own, so a bad term in one entry does not lose the
+        types of the other entries.
+
+        Args:
+            entries: Dictionary entries of the array context, in order
+
+        Returns:
+            Dictionary mapping terms to their expanded type URIs
+        """
+        type_uris = cls._try_expand_term_types(
+            entries, [key for ctx in entries for key in cls._typed_terms(ctx)]
+        )
+        if type_uris is not None:
+            return type_uris
+
+        type_uris = {}
+        for index, entry in enumerate(entries):
+            keys = cls._typed_terms(entry)
+            entry_uris = cls._try_expand_term_types(entries[: index + 1], keys)
+            if entry_uris is None:
+                entry_uris = cls._expand_term_types(entry, keys)
+            type_uris.update(entry_uris)
+
+        return type_uris
+
+    @classmethod
+    def _expand_term_types(
+        cls, context: Dict[str, Any], keys: List[str]
+    ) -> Dict[str, str]:
+        """
+        Resolve the coerced type URIs of context terms using pyld's expand().
+
+        All terms are expanded together in one synthetic document, so the
+        context is only processed once. If pyld rejects the combined
+        document, terms are expanded one at a time so a single bad term does
+        not lose the types of the others.
+
+        Args:
+            context: JSON-LD context dictionary
+            keys: Terms in the context that have @type coercion
+
+        Returns:
+            Dictionary mapping terms to their expanded type URIs
+        """
+        type_uris = cls._try_expand_term_types(context, keys)
+        if type_uris is not None:
+            return type_uris
+
+        type_uris = {}
+        for key in keys:
+            # If pyld cannot process this property, continue
+            type_uris.update(cls._try_expand_term_types(context, [key]) or {})
+
+        return type_uris
+
+    @classmethod
+    def _try_expand_term_types(
+        cls, context: Union[Dict[str, Any], List[Any]], keys: List[str]
+    ) -> Optional[Dict[str, str]]:
+        """
+        Expand context terms in one synthetic document.
+
+        Each term's value is its own name, which identifies the term again in
+        the expanded output.
+
+        Args:
+            context: JSON-LD context dictionary, or array of them
+            keys: Terms in the context that have @type coercion
+
+        Returns:
+            Dictionary mapping terms to their expanded type URIs, or None if
+            pyld rejects the document
+        """
+        if not keys:
+            return {}
+
+        try:
+            return cls._read_term_types(
+                jsonld.expand({"@context": context, **{key: key for key in keys}})
+            )
+        except (jsonld.JsonLdError, ValueError, TypeError):
+            return None
+
+    @classmethod
+    def _read_term_types(cls, expanded: List[Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Collect term type URIs from a document expanded by _expand_term_types.
+
+        Args:
+            expanded: Expanded form of the synthetic term document
+
+        Returns:
+            Dictionary mapping terms to their expanded type URIs
+        """
+        type_uris: Dict[str, str] = {}
+        if not expanded:
+            return type_uris
+
+        for prop_uri, prop_values in expanded[0].items():
+            if prop_uri.startswith("@") or not isinstance(prop_values, list):
+                continue
+            for prop_value in prop_values:
+                if not isinstance(prop_value, dict) or "@value" not in prop_value:
+                    continue
+                type_uri = prop_value.get("@type")
+                if type_uri:
+                    type_uris[prop_value["@value"]] = type_uri
+
+        return type_uris
+
     def _process_frame_object(
         self,
         frame: Dict[str, Any],
         schema: Dict[str, Any],
-        flags: Dict[str, Any],
-        context: Dict[str, Optional[str]],
+        flags: _FramingFlags,
+        context: Mapping[str, Optional[_TermInfo]],
     ) -> None:
         """
         Process a frame object and populate the schema.
@@ -280,28 +572,27 @@ class FrameToSchemaConverter:
         properties: Dict[str, Any] = {}
         required: List[str] = []
 
-        # Process @type constraint
+        # Process @type and @id constraints first, so they lead the schema's
+        # properties and required list wherever they appear in the frame
         if "@type" in frame:
-            type_schema = self._process_type_constraint(frame["@type"])
-            properties["@type"] = type_schema
-            if not self._is_wildcard(frame["@type"]):
+            type_value = frame["@type"]
+            properties["@type"] = self._process_type_constraint(type_value)
+            if not _is_wildcard(type_value):
                 required.append("@type")
 
-        # Process @id constraint
         if "@id" in frame:
-            id_schema = self._process_id_constraint(frame["@id"])
-            properties["@id"] = id_schema
-            if not self._is_empty(frame["@id"]):
+            id_value = frame["@id"]
+            properties["@id"] = self._process_id_constraint(id_value)
+            if not _is_empty(id_value):
                 required.append("@id")
 
         # Note: @reverse is a framing keyword used for querying,
         # not a property that appears in the output, so we skip it
 
-        # Process regular properties
+        # Process regular properties in a single pass over the frame
+        non_property_keys = self.NON_PROPERTY_KEYS
         for key, value in frame.items():
-            if key in self.FRAMING_KEYWORDS:
-                continue
-            if key in ("@type", "@id"):
+            if key in non_property_keys:
                 continue
 
             prop_schema = self._process_property(key, value, flags, context)
@@ -319,7 +610,7 @@ class FrameToSchemaConverter:
             schema["required"] = required
 
         # Apply @explicit flag
-        schema["additionalProperties"] = not flags["explicit"]
+        schema["additionalProperties"] = not flags.explicit
 
     def _process_type_constraint(self, type_value: Any) -> Dict[str, Any]:
         """
@@ -343,7 +634,7 @@ class FrameToSchemaConverter:
             else:
                 # Multiple types - use enum
                 return {"enum": type_value}
-        elif self._is_empty(type_value):
+        elif _is_empty(type_value):
             # {} means @type must be present but any value
             return {"type": "string"}
 
@@ -362,7 +653,7 @@ class FrameToSchemaConverter:
         if isinstance(id_value, str):
             # Specific ID value
             return {"const": id_value}
-        elif self._is_empty(id_value):
+        elif _is_empty(id_value):
             # {} means @id must be present
             return {"type": "string", "format": "uri"}
         elif isinstance(id_value, dict) and "@id" in id_value:
@@ -375,8 +666,8 @@ class FrameToSchemaConverter:
         self,
         key: str,
         value: Any,
-        flags: Dict[str, Any],
-        context: Dict[str, Optional[str]],
+        flags: _FramingFlags,
+        context: Mapping[str, Optional[_TermInfo]],
     ) -> Dict[str, Any]:
         """
         Process a property from the frame.
@@ -390,24 +681,24 @@ class FrameToSchemaConverter:
         Returns:
             JSON Schema property definition
         """
-        # Get type information from context if available
-        context_type = context.get(key)
-
-        if self._is_empty(value):
-            # {} means property must be present
-            return self._infer_type_from_context(key, context_type)
+        # Dicts ({} and nested frames) are by far the most common values,
+        # so they are checked first
+        if isinstance(value, dict):
+            if not value:
+                # {} means property must be present; only this case uses the
+                # type information from the context
+                return self._infer_type_from_context(key, context.get(key))
+            # Check if this is a value object frame (has @value with @language or @type)
+            if self._is_value_object_frame(value):
+                return self._process_value_object_frame(value, flags, context)
+            # Nested object frame
+            return self._process_nested_frame(value, flags, context)
         elif isinstance(value, (str, int, float, bool)):
             # Literal value - use as default
             return {"type": self._infer_json_type(value), "default": value}
         elif isinstance(value, list):
             # Array frame
             return self._process_array_frame(value, flags, context)
-        elif isinstance(value, dict):
-            # Check if this is a value object frame (has @value with @language or @type)
-            if self._is_value_object_frame(value):
-                return self._process_value_object_frame(value, flags, context)
-            # Nested object frame
-            return self._process_nested_frame(value, flags, context)
 
         return {}
 
@@ -437,14 +728,14 @@ class FrameToSchemaConverter:
         return False
 
     def _infer_type_from_context(
-        self, key: str, context_type: Optional[str]
+        self, key: str, context_type: Optional[_TermInfo]
     ) -> Dict[str, Any]:
         """
         Infer JSON Schema type from JSON-LD context type or container.
 
         Args:
             key: Property name
-            context_type: Type from context, container spec, or combination of both
+            context_type: Container keyword and type URI from context, if any
 
         Returns:
             JSON Schema type definition
@@ -452,90 +743,30 @@ class FrameToSchemaConverter:
         if context_type is None:
             return {"type": "string"}
 
-        # Check if this contains both container and type (separated by CONTEXT_SEPARATOR)
-        container_spec = None
-        type_spec = None
+        container_type, type_spec = context_type
 
-        if self.CONTEXT_SEPARATOR in context_type:
-            # Split and identify parts
-            parts = context_type.split(self.CONTEXT_SEPARATOR)
-            for part in parts:
-                if part.startswith(self.CONTAINER_PREFIX):
-                    container_spec = part
+        # Process container if present; unsupported containers fall through
+        if container_type is not None:
+            build_container_schema = _CONTAINER_SCHEMA_BUILDERS.get(container_type)
+            if build_container_schema is not None:
+                # Get the item schema (either from type_spec or default to string)
+                if type_spec and type_spec in self.TYPE_MAPPINGS:
+                    item_schema = dict(self.TYPE_MAPPINGS[type_spec])
                 else:
-                    type_spec = part
-        elif context_type.startswith(self.CONTAINER_PREFIX):
-            container_spec = context_type
-        else:
-            type_spec = context_type
-
-        # Process container if present
-        if container_spec:
-            # Extract container type using structured approach
-            container_type = container_spec[len(self.CONTAINER_PREFIX) :]
-
-            # Get the item schema (either from type_spec or default to string)
-            if type_spec and type_spec in self.TYPE_MAPPINGS:
-                item_schema = copy.deepcopy(self.TYPE_MAPPINGS[type_spec])
-            else:
-                item_schema = {"type": "string"}
-
-            if container_type == "@language":
-                # Language map: allows string or object with language codes as keys
-                # BCP 47 language tags: language[-script][-region][-variant][-extension][-privateuse]
-                # This pattern is more permissive to handle common cases
-                return {
-                    "oneOf": [
-                        item_schema,
-                        {
-                            "type": "object",
-                            "patternProperties": {
-                                # Matches: en, en-US, es-419, zh-Hans-CN, etc.
-                                "^[a-z]{2,3}(-[A-Z][a-z]{3})?(-[A-Z]{2}|-[0-9]{3})?(-[a-z0-9]+)*$": item_schema
-                            },
-                            "additionalProperties": False,
-                        },
-                    ]
-                }
-            elif container_type == "@index":
-                # Index container: object with arbitrary keys
-                # Only add items schema if there's type coercion
-                if type_spec:
-                    return {
-                        "type": "object",
-                        "additionalProperties": item_schema,
-                    }
-                else:
-                    return {
-                        "type": "object",
-                        "additionalProperties": {"type": "string"},
-                    }
-            elif container_type == "@set":
-                # Set container: array with unique items
-                # Only add items schema if there's type coercion
-                if type_spec:
-                    return {"type": "array", "uniqueItems": True, "items": item_schema}
-                else:
-                    return {"type": "array", "uniqueItems": True}
-            elif container_type == "@list":
-                # List container: ordered array
-                # Only add items schema if there's type coercion
-                if type_spec:
-                    return {"type": "array", "items": item_schema}
-                else:
-                    return {"type": "array"}
+                    item_schema = {"type": "string"}
+                return build_container_schema(item_schema, bool(type_spec))
 
         # Map JSON-LD types to JSON Schema types (no container)
         if type_spec and type_spec in self.TYPE_MAPPINGS:
-            return copy.deepcopy(self.TYPE_MAPPINGS[type_spec])
+            return dict(self.TYPE_MAPPINGS[type_spec])
 
         return {"type": "string"}
 
     def _process_array_frame(
         self,
         array_value: List[Any],
-        flags: Dict[str, Any],
-        context: Dict[str, Optional[str]],
+        flags: _FramingFlags,
+        context: Mapping[str, Optional[_TermInfo]],
     ) -> Dict[str, Any]:
         """
         Process an array frame.
@@ -564,8 +795,8 @@ class FrameToSchemaConverter:
     def _process_nested_frame(
         self,
         frame_obj: Dict[str, Any],
-        flags: Dict[str, Any],
-        context: Dict[str, Optional[str]],
+        flags: _FramingFlags,
+        context: Mapping[str, Optional[_TermInfo]],
     ) -> Dict[str, Any]:
         """
         Process a nested frame object.
@@ -578,16 +809,9 @@ class FrameToSchemaConverter:
         Returns:
             JSON Schema nested object definition
         """
-        # Extract nested framing flags (can override parent)
-        nested_flags = {
-            "embed": frame_obj.get("@embed", flags["embed"]),
-            "explicit": frame_obj.get("@explicit", flags["explicit"]),
-            "requireAll": frame_obj.get("@requireAll", flags["requireAll"]),
-            "omitDefault": frame_obj.get("@omitDefault", flags["omitDefault"]),
-        }
-
-        # Check @embed flag
-        embed_value = nested_flags["embed"]
+        # Check @embed flag before building nested flags, which a reference
+        # does not need
+        embed_value = frame_obj.get("@embed", flags.embed)
         if embed_value is False or embed_value == "@never":
             # Only reference, not embedded
             return {
@@ -602,6 +826,18 @@ class FrameToSchemaConverter:
                 ]
             }
 
+        # Extract nested framing flags (can override parent). Flags are
+        # immutable, so the parent's are shared when none is overridden
+        if frame_obj.keys().isdisjoint(self.FLAG_KEYWORDS):
+            nested_flags = flags
+        else:
+            nested_flags = _FramingFlags(
+                embed=embed_value,
+                explicit=frame_obj.get("@explicit", flags.explicit),
+                require_all=frame_obj.get("@requireAll", flags.require_all),
+                omit_default=frame_obj.get("@omitDefault", flags.omit_default),
+            )
+
         # Embedded object
         nested_schema: Dict[str, Any] = {"type": "object"}
         self._process_frame_object(frame_obj, nested_schema, nested_flags, context)
@@ -611,8 +847,8 @@ class FrameToSchemaConverter:
     def _process_value_object_frame(
         self,
         value_frame: Dict[str, Any],
-        flags: Dict[str, Any],
-        context: Dict[str, Optional[str]],
+        flags: _FramingFlags,
+        context: Mapping[str, Optional[_TermInfo]],
     ) -> Dict[str, Any]:
         """
         Process value object frame (contains @value with @language and/or @type).
@@ -645,7 +881,7 @@ class FrameToSchemaConverter:
                 # Specific language required
                 value_obj_schema["properties"]["@language"] = {"const": lang}
                 value_obj_schema["required"].append("@language")
-            elif self._is_empty(lang):
+            elif _is_empty(lang):
                 # Any language allowed
                 value_obj_schema["properties"]["@language"] = {"type": "string"}
                 value_obj_schema["required"].append("@language")
@@ -656,7 +892,7 @@ class FrameToSchemaConverter:
             if isinstance(type_val, str):
                 value_obj_schema["properties"]["@type"] = {"const": type_val}
                 value_obj_schema["required"].append("@type")
-            elif self._is_empty(type_val):
+            elif _is_empty(type_val):
                 value_obj_schema["properties"]["@type"] = {"type": "string"}
                 value_obj_schema["required"].append("@type")
 
@@ -664,7 +900,7 @@ class FrameToSchemaConverter:
 
         return {"oneOf": schemas}
 
-    def _should_be_required(self, key: str, value: Any, flags: Dict[str, Any]) -> bool:
+    def _should_be_required(self, key: str, value: Any, flags: _FramingFlags) -> bool:
         """
         Determine if a property should be required.
 
@@ -677,15 +913,15 @@ class FrameToSchemaConverter:
             True if property should be required
         """
         # If @requireAll is true, all properties are required
-        if flags["requireAll"]:
+        if flags.require_all:
             return True
 
         # If @omitDefault is true, properties are optional
-        if flags["omitDefault"]:
+        if flags.omit_default:
             return False
 
         # If value is {}, property is required
-        if self._is_empty(value):
+        if _is_empty(value):
             return True
 
         # For nested objects and arrays, typically required
@@ -694,14 +930,6 @@ class FrameToSchemaConverter:
 
         return False
 
-    def _is_empty(self, value: Any) -> bool:
-        """Check if value is an empty dict."""
-        return isinstance(value, dict) and len(value) == 0
-
-    def _is_wildcard(self, value: Any) -> bool:
-        """Check if value is a wildcard (empty dict or array)."""
-        return self._is_empty(value) or (isinstance(value, list) and len(value) == 0)
-
     def _infer_json_type(self, value: Any) -> str:
         """
         Infer JSON type from a Python value.
@@ -712,6 +940,11 @@ class FrameToSchemaConverter:
         Returns:
             JSON type string
         """
+        json_type = self.JSON_TYPE_NAMES.get(type(value))
+        if json_type is not None:
+            return json_type
+
+        # Subclasses of the builtin types (e.g. OrderedDict) need isinstance
         if isinstance(value, bool):
             return "boolean"
         elif isinstance(value, int):
@@ -732,7 +965,7 @@ class FrameToSchemaConverter:
 
 def frame_to_schema(
     frame: Dict[str, Any],
-    schema_version: str = "https://json-schema.org/draft/2020-12/schema",
+    schema_version: str = DEFAULT_SCHEMA_VERSION,
     graph_only: bool = False,
 ) -> Dict[str, Any]:
     """
@@ -769,3 +1002,56 @@ def frame_to_schema(
         schema_version=schema_version, graph_only=graph_only
     )
     return converter.convert(frame)
+
+
+@lru_cache(maxsize=128)
+def _frame_to_schema_for_key(
+    frame_key: str, schema_version: str, graph_only: bool
+) -> str:
+    """
+    Convert a serialized frame, memoizing the serialized schema.
+
+    Schemas are cached as JSON text rather than as dicts: json.loads builds a
+    fresh copy for each caller several times faster than copy.deepcopy.
+    """
+    return json.dumps(
+        frame_to_schema(
+            json.loads(frame_key), schema_version=schema_version, graph_only=graph_only
+        ),
+        separators=(",", ":"),
+    )
+
+
+def frame_to_schema_cached(
+    frame: Dict[str, Any],
+    schema_version: str = DEFAULT_SCHEMA_VERSION,
+    graph_only: bool = False,
+) -> Dict[str, Any]:
+    """
+    Convert a JSON-LD Frame to JSON Schema, reusing results for repeated frames.
+
+    Frames are keyed by their compact JSON serialization, so converting an
+    identical frame again skips the recursive conversion. Key order is kept in
+    the cache key because it determines property order in the output schema.
+    Each call returns a fresh copy, so callers may mutate the result freely.
+
+    Args:
+        frame: JSON-LD Frame object
+        schema_version: JSON Schema version URI to use
+        graph_only: If True, output only the schema for @graph items
+
+    Returns:
+        JSON Schema document
+    """
+    try:
+        frame_key = json.dumps(frame, separators=(",", ":"))
+    except (TypeError, ValueError):
+        # Not JSON-serializable, so it cannot be used as a cache key
+        return frame_to_schema(
+            frame, schema_version=schema_version, graph_only=graph_only
+        )
+
+    result: Dict[str, Any] = json.loads(
+        _frame_to_schema_for_key(frame_key, schema_version, graph_only)
+    )
+    return result
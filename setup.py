@@ -0,0 +1,22 @@
+"""
+Optional compiled build for jsonldframe2schema.
+
+Project metadata lives in pyproject.toml. Setting JLF2S_MYPYC=1 compiles the
+converter module to a C extension with mypyc (installed with mypy), e.g.:
+
+    JLF2S_MYPYC=1 pip install --no-build-isolation .
+"""
+
+import os
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("JLF2S_MYPYC"):
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(
+        ["--ignore-missing-imports", "jsonldframe2schema/converter.py"]
+    )
+
+setup(ext_modules=ext_modules)
@@ -60,8 +60,9 @@ def load_json_file(path: Path) -> Optional[Dict[str, Any]]:
     """
     if not path.exists():
         return None
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    # Parsed with json rather than orjson, which silently reads integers
+    # beyond 64 bits as floats
+    return json.loads(path.read_bytes())
 
 
 def compare_schemas(
@@ -78,6 +79,13 @@ def compare_schemas(
     Returns:
         Tuple of (is_match, error_message). error_message is None if match.
     """
+    # Identical serializations settle the common (matching) case quickly;
+    # DeepDiff is only needed for order-insensitive list comparison and for
+    # describing mismatches. Comparing JSON text rather than using == keeps
+    # True distinct from 1 and 1.0, as DeepDiff does.
+    if json.dumps(actual, sort_keys=True) == json.dumps(expected, sort_keys=True):
+        return True, None
+
     diff = DeepDiff(expected, actual, ignore_order=True)
 
     if not diff:
@@ -5,41 +5,263 @@ Download the official JSON-LD Framing test suite from W3C.
 This script downloads the frame test manifest and all referenced test files
 (input, frame, and expected output) to a local directory for testing.
 
-The manifest is parsed as proper JSON-LD using pyld and rdflib to correctly
-handle @context, @base, and other JSON-LD features.
+Test entries are read directly from the manifest as published, whose small
+static context maps short keys (name, input, frame, expect, ...) onto the test
+vocabulary. If the manifest does not have that shape, it is expanded with pyld
+instead, which resolves @context, @base and other JSON-LD features. An rdflib
+graph of the manifest is only built on request: set JLD_BUILD_RDF_GRAPH, or
+call load_manifest_graph() / query_manifest_sparql().
 """
 
+import base64
+import hashlib
+import http.client
 import json
-import urllib.request
+import os
+import shutil
+import threading
 import urllib.error
-from typing import Dict, List, Any, Optional
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Tuple
 from pathlib import Path
 
 from pyld import jsonld
-from rdflib import Graph, Namespace
 
+if TYPE_CHECKING:
+    # rdflib is slow to import and only needed for the opt-in RDF graph, so
+    # the functions that use it import it themselves
+    from rdflib import Graph
+
+try:
+    import orjson
+except ImportError:  # optional, as in the CLI
+    orjson = None
 
 BASE_URL = "https://w3c.github.io/json-ld-framing/tests/"
 FRAME_MANIFEST_URL = BASE_URL + "frame-manifest.jsonld"
 TEST_SUITE_DIR = Path(__file__).parent / "jsonld_test_suite"
 
+# Number of test files fetched concurrently (downloads are latency-bound)
+DOWNLOAD_WORKERS = 16
+
+# Chunk size (in bytes) used when streaming downloaded files to disk
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Redirects followed for one request before it fails
+MAX_REDIRECTS = 5
+
+# Per-thread keep-alive HTTP connections and their proxy headers (see _connect()),
+# keyed by (scheme, host), plus every connection opened so close_connections()
+# can close them when downloads end
+_connections = threading.local()
+_open_connections: List[http.client.HTTPConnection] = []
+_open_connections_lock = threading.Lock()
+
 # JSON-LD Test vocabulary namespace
-MF = Namespace("http://www.w3.org/2001/sw/DataAccess/tests/test-manifest#")
-JLD = Namespace("https://w3c.github.io/json-ld-api/tests/vocab#")
+MF_NS = "http://www.w3.org/2001/sw/DataAccess/tests/test-manifest#"
+JLD_NS = "https://w3c.github.io/json-ld-api/tests/vocab#"
+
+# Manifest graph parsed by load_manifest_graph(), keyed by (path, mtime)
+_GRAPH_CACHE: Dict[Tuple[str, float], "Graph"] = {}
+
+# Expanded manifest keys and test types
+MF_ENTRIES = MF_NS + "entries"
+MF_NAME = MF_NS + "name"
+JLD_PURPOSE = JLD_NS + "purpose"
+JLD_INPUT = JLD_NS + "input"
+JLD_FRAME = JLD_NS + "frame"
+JLD_EXPECT = JLD_NS + "expect"
+JLD_EXPECT_ERROR_CODE = JLD_NS + "expectErrorCode"
+JLD_OPTION = JLD_NS + "option"
+JLD_POSITIVE_TEST = JLD_NS + "PositiveEvaluationTest"
+JLD_NEGATIVE_TEST = JLD_NS + "NegativeEvaluationTest"
+
+
+def _loads(data: bytes) -> Any:
+    """
+    Parse JSON bytes with the json module.
+
+    orjson is not used here: it silently reads integers beyond 64 bits as
+    floats, which would change test documents.
+    """
+    return json.loads(data)
+
+
+def _write_json(path: Path, data: Any, indent: bool = True) -> None:
+    """Write JSON to a file, two-space indented unless indent is False."""
+    if orjson is not None:
+        try:
+            option = orjson.OPT_INDENT_2 if indent else 0
+            path.write_bytes(orjson.dumps(data, option=option))
+            return
+        except orjson.JSONEncodeError:
+            pass
+    path.write_text(json.dumps(data, indent=2 if indent else None), encoding="utf-8")
+
+
+def _connect(
+    scheme: str, netloc: str
+) -> Tuple[http.client.HTTPConnection, Optional[Dict[str, str]]]:
+    """
+    Open a connection to a host, through a proxy if the environment sets one.
+
+    Proxies are taken from the *_proxy and no_proxy environment variables, as
+    urllib does. HTTPS requests are tunnelled through the proxy with CONNECT;
+    plain HTTP requests are sent to the proxy with the full URL.
+
+    Returns:
+        The connection, and the headers to send with each request when it
+        must use the full URL (None for a direct or tunnelled connection)
+    """
+    connection_class = (
+        http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+    )
+    proxy = urllib.request.getproxies().get(scheme)
+    if not proxy or urllib.request.proxy_bypass(netloc):
+        return connection_class(netloc, timeout=30), None
+
+    if "://" not in proxy:
+        proxy = "http://" + proxy
+    proxy_parts = urllib.parse.urlsplit(proxy)
+    proxy_headers = {}
+    if proxy_parts.username is not None:
+        credentials = "%s:%s" % (
+            urllib.parse.unquote(proxy_parts.username),
+            urllib.parse.unquote(proxy_parts.password or ""),
+        )
+        proxy_headers["Proxy-Authorization"] = "Basic " + base64.b64encode(
+            credentials.encode("utf-8")
+        ).decode("ascii")
+    proxy_host = proxy_parts.netloc.rpartition("@")[2]
+
+    if scheme == "https":
+        conn = http.client.HTTPSConnection(proxy_host, timeout=30)
+        conn.set_tunnel(netloc, headers=proxy_headers)
+        return conn, None
+    if proxy_parts.scheme == "https":
+        return http.client.HTTPSConnection(proxy_host, timeout=30), proxy_headers
+    return http.client.HTTPConnection(proxy_host, timeout=30), proxy_headers
+
+
+def _send_get(url: str) -> http.client.HTTPResponse:
+    """Send one GET request on this thread's keep-alive connection to the host."""
+    parts = urllib.parse.urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+
+    by_host = getattr(_connections, "by_host", None)
+    if by_host is None:
+        by_host = _connections.by_host = {}
+    key = (parts.scheme, parts.netloc)
+
+    retried = False
+    while True:
+        entry = by_host.get(key)
+        if entry is None:
+            entry = by_host[key] = _connect(parts.scheme, parts.netloc)
+            with _open_connections_lock:
+                _open_connections.append(entry[0])
+        conn, proxy_headers = entry
+        try:
+            if proxy_headers is None:
+                conn.request("GET", path)
+            else:
+                # A plain HTTP proxy takes the full URL (without the fragment)
+                conn.request(
+                    "GET", parts._replace(fragment="").geturl(), headers=proxy_headers
+                )
+            return conn.getresponse()
+        except (http.client.HTTPException, OSError):
+            # The server may have closed an idle connection; retry once
+            conn.close()
+            del by_host[key]
+            if retried:
+                raise
+            retried = True
+
+
+def http_open(url: str) -> http.client.HTTPResponse:
+    """
+    Request a URL, reusing this thread's keep-alive connection to the host.
+
+    All test files live on one host, so keeping the connection open saves a
+    TCP and TLS handshake per file compared to a fresh urlopen() each time.
+    Up to MAX_REDIRECTS redirects are followed. The body of the returned
+    response must be read in full before the thread makes another request.
+
+    Raises:
+        urllib.error.HTTPError: If the server responds with an error status,
+            or redirects more than MAX_REDIRECTS times
+        OSError, http.client.HTTPException: If the request fails
+    """
+    for _ in range(MAX_REDIRECTS + 1):
+        response = _send_get(url)
+        if response.status == 200:
+            return response
+
+        # Drain the body so the connection can be reused
+        response.read()
+        location = response.getheader("Location")
+        if response.status not in (301, 302, 303, 307, 308) or not location:
+            raise urllib.error.HTTPError(
+                url, response.status, response.reason, response.headers, None
+            )
+        url = urllib.parse.urljoin(url, location)
+
+    raise urllib.error.HTTPError(
+        url,
+        response.status,
+        f"Too many redirects (more than {MAX_REDIRECTS})",
+        response.headers,
+        None,
+    )
+
+
+def close_connections() -> None:
+    """Close every keep-alive connection opened by http_open()."""
+    global _connections
+    with _open_connections_lock:
+        connections = list(_open_connections)
+        _open_connections.clear()
+        # Forget the per-thread pools, so later requests open new connections
+        _connections = threading.local()
+    for conn in connections:
+        conn.close()
+
+
+def http_get(url: str) -> bytes:
+    """Fetch the body of a URL; see http_open()."""
+    return http_open(url).read()
 
 
 def create_document_loader():
     """
     Create a custom document loader for pyld that can fetch remote contexts.
+
+    pyld requests the same contexts over and over while expanding the manifest
+    and test files, so documents are cached in memory and on disk under
+    TEST_SUITE_DIR/.context_cache, and each URL is fetched at most once.
     """
+    cache: Dict[str, Any] = {}
 
     def loader(url, options=None):
         """Custom document loader that fetches remote documents."""
         try:
-            with urllib.request.urlopen(url, timeout=30) as response:
-                content = response.read().decode("utf-8")
-                doc = json.loads(content)
-                return {"contextUrl": None, "documentUrl": url, "document": doc}
+            if url not in cache:
+                digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+                cache_file = TEST_SUITE_DIR / ".context_cache" / f"{digest}.json"
+                if cache_file.is_file():
+                    content = cache_file.read_bytes()
+                else:
+                    content = http_get(url)
+                    cache_file.parent.mkdir(parents=True, exist_ok=True)
+                    cache_file.write_bytes(content)
+                cache[url] = _loads(content)
+            doc = cache[url]
+            return {"contextUrl": None, "documentUrl": url, "document": doc}
         except Exception:
             raise jsonld.JsonLdError(
                 f"Could not load document: {url}",
@@ -52,25 +274,63 @@ def create_document_loader():
 
 
 # Set up the document loader for pyld
-jsonld.set_document_loader(create_document_loader())
+_document_loader = create_document_loader()
+jsonld.set_document_loader(_document_loader)
+
+
+def prefetch_contexts(doc: Any, base_url: str) -> None:
+    """
+    Load a document's remote top-level contexts concurrently.
+
+    pyld fetches remote contexts one at a time as it meets them; warming the
+    document loader's cache first overlaps those round trips. Failures are
+    left for pyld to report when it requests the context itself.
+    """
+    context = doc.get("@context") if isinstance(doc, dict) else None
+    entries = context if isinstance(context, list) else [context]
+    urls = {urllib.parse.urljoin(base_url, e) for e in entries if isinstance(e, str)}
+    if len(urls) < 2:
+        return
+
+    def prefetch(url: str) -> None:
+        try:
+            _document_loader(url)
+        except jsonld.JsonLdError:
+            pass
+
+    with ThreadPoolExecutor(max_workers=min(len(urls), DOWNLOAD_WORKERS)) as executor:
+        list(executor.map(prefetch, urls))
 
 
-def download_jsonld(url: str) -> Optional[Dict[str, Any]]:
+def download_jsonld(url: str, expand: bool = True) -> Optional[Dict[str, Any]]:
     """
     Download and parse a JSON-LD file from URL using pyld.
 
-    This properly handles JSON-LD features like @context and @base.
+    This properly handles JSON-LD features like @context and @base. The
+    expanded form only depends on the URL and the document bytes, so it is
+    cached in TEST_SUITE_DIR under a hash of both and reused on later runs.
+    With expand=False the document is only parsed as JSON, and "expanded"
+    is None. The raw response body is returned as "content".
     """
     try:
-        with urllib.request.urlopen(url, timeout=30) as response:
-            content = response.read().decode("utf-8")
-            doc = json.loads(content)
-
+        content = http_get(url)
+        doc = _loads(content)
+        if not expand:
+            return {"original": doc, "expanded": None, "content": content}
+
+        digest = hashlib.sha1(url.encode("utf-8") + b"\n" + content).hexdigest()
+        cache_file = TEST_SUITE_DIR / f".expanded.{digest}.json"
+        if cache_file.is_file():
+            expanded = _loads(cache_file.read_bytes())
+        else:
             # Expand the JSON-LD to resolve all IRIs
+            prefetch_contexts(doc, url)
             expanded = jsonld.expand(doc, {"base": url})
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            _write_json(cache_file, expanded, indent=False)
 
-            return {"original": doc, "expanded": expanded}
-    except (urllib.error.URLError, urllib.error.HTTPError, json.JSONDecodeError) as e:
+        return {"original": doc, "expanded": expanded, "content": content}
+    except (OSError, http.client.HTTPException, json.JSONDecodeError) as e:
         print(f"Error downloading {url}: {e}")
         return None
     except jsonld.JsonLdError as e:
@@ -79,34 +339,76 @@ def download_jsonld(url: str) -> Optional[Dict[str, Any]]:
 
 
 def download_file(url: str, local_path: Path) -> bool:
-    """Download a file from URL to local path."""
+    """
+    Download a file from URL to local path.
+
+    Files that already exist with content are kept, so rerunning the download
+    only fetches tests added to the manifest since the last run.
+    """
+    if local_path.is_file() and local_path.stat().st_size > 0:
+        return True
     try:
+        response = http_open(url)
         local_path.parent.mkdir(parents=True, exist_ok=True)
-        with urllib.request.urlopen(url, timeout=30) as response:
-            content = response.read()
-            with open(local_path, "wb") as f:
-                f.write(content)
-            return True
-    except (urllib.error.URLError, urllib.error.HTTPError) as e:
+        # Stream to a temporary file so an interrupted download never leaves a
+        # partial file that a rerun would keep
+        part_path = local_path.with_name(local_path.name + ".part")
+        with open(part_path, "wb") as f:
+            shutil.copyfileobj(response, f, DOWNLOAD_CHUNK_SIZE)
+        part_path.replace(local_path)
+        return True
+    except (OSError, http.client.HTTPException) as e:
         print(f"Error downloading {url}: {e}")
         return False
 
 
 def parse_manifest_with_rdflib(
     manifest_url: str, manifest_doc: Dict[str, Any]
-) -> Graph:
+) -> "Graph":
     """
     Parse the manifest JSON-LD into an RDF graph using rdflib.
 
     This allows us to query the manifest using SPARQL or RDF patterns.
+    pyld converts the manifest to N-Quads, which rdflib parses much faster
+    than it parses JSON-LD itself.
     """
+    from rdflib import Graph
+
     g = Graph()
+    g.parse(data=manifest_to_nquads(manifest_url, manifest_doc), format="nquads")
+    return g
 
-    # Serialize the original doc to JSON-LD string and parse with rdflib
-    jsonld_str = json.dumps(manifest_doc)
-    g.parse(data=jsonld_str, format="json-ld", base=manifest_url)
 
-    return g
+def manifest_to_nquads(manifest_url: str, manifest_doc: Dict[str, Any]) -> str:
+    """Convert the manifest to an N-Quads string using pyld."""
+    return jsonld.to_rdf(
+        manifest_doc, {"base": manifest_url, "format": "application/n-quads"}
+    )
+
+
+def _expanded_value(test: Dict[str, Any], key: str) -> Optional[str]:
+    """Extract the first string value of a property from an expanded test."""
+    values = test.get(key)
+    if not values:
+        return None
+    val = values[0]
+    if isinstance(val, dict):
+        # Could be @value or @id
+        return val.get("@value") or val.get("@id")
+    return val
+
+
+def _expanded_path(test: Dict[str, Any], key: str, base_url: str) -> Optional[str]:
+    """Extract a file reference from an expanded test, relative to base_url."""
+    values = test.get(key)
+    if not values:
+        return None
+    val = values[0]
+    full_uri = val.get("@id", "") if isinstance(val, dict) else val
+    # Convert full URI back to relative path
+    if full_uri.startswith(base_url):
+        return full_uri[len(base_url) :]
+    return full_uri
 
 
 def extract_test_info_from_expanded(
@@ -126,63 +428,23 @@ def extract_test_info_from_expanded(
     test_types = test.get("@type", [])
 
     # Determine if it's a positive or negative evaluation test
-    is_positive = (
-        "https://w3c.github.io/json-ld-api/tests/vocab#PositiveEvaluationTest"
-        in test_types
-    )
-    is_negative = (
-        "https://w3c.github.io/json-ld-api/tests/vocab#NegativeEvaluationTest"
-        in test_types
-    )
-
-    # Helper to extract string value from expanded JSON-LD
-    def get_value(key: str) -> Optional[str]:
-        values = test.get(key, [])
-        if values and len(values) > 0:
-            val = values[0]
-            if isinstance(val, dict):
-                # Could be @value or @id
-                return val.get("@value") or val.get("@id")
-            return val
-        return None
-
-    # Helper to extract relative path from full URI
-    def get_relative_path(key: str) -> Optional[str]:
-        values = test.get(key, [])
-        if values and len(values) > 0:
-            val = values[0]
-            if isinstance(val, dict):
-                full_uri = val.get("@id", "")
-            else:
-                full_uri = val
-            # Convert full URI back to relative path
-            if full_uri.startswith(base_url):
-                return full_uri[len(base_url) :]
-            return full_uri
-        return None
+    is_positive = JLD_POSITIVE_TEST in test_types
+    is_negative = JLD_NEGATIVE_TEST in test_types
 
-    # Extract name and purpose (these use the mf: namespace)
-    name = get_value("http://www.w3.org/2001/sw/DataAccess/tests/test-manifest#name")
-    purpose = get_value("https://w3c.github.io/json-ld-api/tests/vocab#purpose")
+    # Extract name and purpose (these use the mf: and jld: namespaces)
+    name = _expanded_value(test, MF_NAME)
+    purpose = _expanded_value(test, JLD_PURPOSE)
 
     # Extract file paths (these use the jld: namespace)
-    input_path = get_relative_path(
-        "https://w3c.github.io/json-ld-api/tests/vocab#input"
-    )
-    frame_path = get_relative_path(
-        "https://w3c.github.io/json-ld-api/tests/vocab#frame"
-    )
-    expect_path = get_relative_path(
-        "https://w3c.github.io/json-ld-api/tests/vocab#expect"
-    )
-    expect_error = get_value(
-        "https://w3c.github.io/json-ld-api/tests/vocab#expectErrorCode"
-    )
+    input_path = _expanded_path(test, JLD_INPUT, base_url)
+    frame_path = _expanded_path(test, JLD_FRAME, base_url)
+    expect_path = _expanded_path(test, JLD_EXPECT, base_url)
+    expect_error = _expanded_value(test, JLD_EXPECT_ERROR_CODE)
 
     # Extract options
     options = {}
-    option_values = test.get("https://w3c.github.io/json-ld-api/tests/vocab#option", [])
-    if option_values and len(option_values) > 0:
+    option_values = test.get(JLD_OPTION)
+    if option_values:
         opt = option_values[0]
         if isinstance(opt, dict):
             # Extract specific option values
@@ -191,7 +453,7 @@ def extract_test_info_from_expanded(
                     continue
                 # Get the local name from the URI (strip trailing whitespace)
                 local_name = key.split("#")[-1] if "#" in key else key.split("/")[-1]
-                if vals and len(vals) > 0:
+                if vals:
                     val = vals[0]
                     if isinstance(val, dict):
                         options[local_name] = val.get("@value", val.get("@id"))
@@ -222,11 +484,8 @@ def extract_tests_from_expanded(
 
     # The expanded document is a list of nodes
     for node in expanded:
-        # Look for the sequence property (mf:entries or similar)
-        sequence_key = (
-            "http://www.w3.org/2001/sw/DataAccess/tests/test-manifest#entries"
-        )
-        sequence = node.get(sequence_key, [])
+        # Look for the sequence property (mf:entries)
+        sequence = node.get(MF_ENTRIES, [])
 
         if sequence:
             # The sequence is a @list
@@ -245,10 +504,32 @@ def extract_tests_from_expanded(
     return tests
 
 
+def extract_tests_from_compacted(manifest: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Extract test entries directly from the manifest as published.
+
+    The manifest uses a small static context (name, input, frame, expect,
+    ...), so its short keys can be read without a JSON-LD expansion pass.
+
+    Raises:
+        KeyError: If the manifest does not have the expected shape, in which
+            case the caller should fall back to extract_tests_from_expanded
+    """
+    sequence = manifest["sequence"]
+    if not isinstance(sequence, list) or not all(
+        isinstance(test, dict) and "@id" in test and "@type" in test
+        for test in sequence
+    ):
+        raise KeyError("sequence")
+    return [extract_test_info(test) for test in sequence]
+
+
 def extract_test_info(test: Dict[str, Any]) -> Dict[str, Any]:
     """Extract relevant information from a test entry (fallback for non-expanded)."""
     test_id = test.get("@id", "").lstrip("#")
     test_type = test.get("@type", [])
+    if isinstance(test_type, str):
+        test_type = [test_type]
 
     # Determine if it's a positive or negative evaluation test
     is_positive = "jld:PositiveEvaluationTest" in test_type
@@ -272,54 +553,63 @@ def download_test_suite() -> Dict[str, Any]:
     """
     Download the complete JSON-LD framing test suite.
 
-    Uses pyld and rdflib to properly parse the JSON-LD manifest.
+    The manifest's short keys are read directly; pyld is only used to expand
+    it when it does not have the expected shape. Keep-alive connections are
+    closed once the download finishes.
 
     Returns:
         Dictionary containing test metadata and download status.
     """
+    try:
+        return _download_test_suite()
+    finally:
+        close_connections()
+
+
+def _download_test_suite() -> Dict[str, Any]:
+    """Download the test suite; see download_test_suite()."""
     print(f"Downloading JSON-LD Frame test manifest from {FRAME_MANIFEST_URL}")
 
-    # Download and parse the manifest as JSON-LD
-    manifest_data = download_jsonld(FRAME_MANIFEST_URL)
+    # Download the manifest; it is only expanded if reading it directly fails
+    manifest_data = download_jsonld(FRAME_MANIFEST_URL, expand=False)
     if not manifest_data:
         return {"success": False, "error": "Failed to download or parse manifest"}
 
     original_manifest = manifest_data["original"]
-    expanded_manifest = manifest_data["expanded"]
 
     # Create test suite directory
     TEST_SUITE_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Save the original manifest
+    # Save the original manifest as downloaded
     manifest_path = TEST_SUITE_DIR / "frame-manifest.jsonld"
-    with open(manifest_path, "w") as f:
-        json.dump(original_manifest, f, indent=2)
+    manifest_path.write_bytes(manifest_data["content"])
     print(f"Saved manifest to {manifest_path}")
 
-    # Also save the expanded form for debugging
-    expanded_path = TEST_SUITE_DIR / "frame-manifest-expanded.json"
-    with open(expanded_path, "w") as f:
-        json.dump(expanded_manifest, f, indent=2)
-    print(f"Saved expanded manifest to {expanded_path}")
+    # The RDF graph is only reported, not used, so building it is opt-in
+    if os.environ.get("JLD_BUILD_RDF_GRAPH"):
+        try:
+            g = parse_manifest_with_rdflib(FRAME_MANIFEST_URL, original_manifest)
+            print(f"Parsed manifest into RDF graph with {len(g)} triples")
+        except Exception as e:
+            print(f"Warning: Could not parse manifest with rdflib: {e}")
 
-    # Parse with rdflib for potential SPARQL queries
     try:
-        g = parse_manifest_with_rdflib(FRAME_MANIFEST_URL, original_manifest)
-        print(f"Parsed manifest into RDF graph with {len(g)} triples")
-    except Exception as e:
-        print(f"Warning: Could not parse manifest with rdflib: {e}")
-        g = None
-
-    # Extract tests from expanded JSON-LD
-    tests = extract_tests_from_expanded(expanded_manifest, BASE_URL)
-
-    if not tests:
-        # Fallback: try to extract from original manifest if expanded didn't work
-        print("Trying fallback extraction from original manifest...")
-        tests = []
-        for test in original_manifest.get("sequence", []):
-            test_info = extract_test_info(test)
-            tests.append(test_info)
+        tests = extract_tests_from_compacted(original_manifest)
+    except KeyError:
+        # Unexpected shape: expand the manifest as JSON-LD to resolve all IRIs
+        print("Manifest is not in the expected form, expanding it as JSON-LD...")
+        manifest_data = download_jsonld(FRAME_MANIFEST_URL)
+        if not manifest_data:
+            return {"success": False, "error": "Failed to download or parse manifest"}
+        expanded_manifest = manifest_data["expanded"]
+
+        # Also save the expanded form for debugging, if asked to
+        if os.environ.get("JLD_SAVE_EXPANDED"):
+            expanded_path = TEST_SUITE_DIR / "frame-manifest-expanded.json"
+            _write_json(expanded_path, expanded_manifest)
+            print(f"Saved expanded manifest to {expanded_path}")
+
+        tests = extract_tests_from_expanded(expanded_manifest, BASE_URL)
 
     downloaded_tests: List[Dict[str, Any]] = []
     failed_downloads: List[str] = []
@@ -327,35 +617,30 @@ def download_test_suite() -> Dict[str, Any]:
     print(f"\nFound {len(tests)} tests in manifest")
     print("Downloading test files...")
 
-    for i, test_info in enumerate(tests):
-        test_id = test_info["id"]
-
-        # Download input file
-        if test_info["input"]:
-            input_url = BASE_URL + test_info["input"]
-            input_path = TEST_SUITE_DIR / test_info["input"]
-            if not download_file(input_url, input_path):
-                failed_downloads.append(f"{test_id}-input")
-
-        # Download frame file
-        if test_info["frame"]:
-            frame_url = BASE_URL + test_info["frame"]
-            frame_path = TEST_SUITE_DIR / test_info["frame"]
-            if not download_file(frame_url, frame_path):
-                failed_downloads.append(f"{test_id}-frame")
-
-        # Download expected output file
-        if test_info["expect"]:
-            expect_url = BASE_URL + test_info["expect"]
-            expect_path = TEST_SUITE_DIR / test_info["expect"]
-            if not download_file(expect_url, expect_path):
-                failed_downloads.append(f"{test_id}-expect")
-
+    # Collect every file to fetch: (label, url, local path)
+    downloads: List[Tuple[str, str, Path]] = []
+    for test_info in tests:
+        for kind in ("input", "frame", "expect"):
+            if test_info[kind]:
+                downloads.append(
+                    (
+                        f"{test_info['id']}-{kind}",
+                        BASE_URL + test_info[kind],
+                        TEST_SUITE_DIR / test_info[kind],
+                    )
+                )
         downloaded_tests.append(test_info)
 
-        # Progress indicator
-        if (i + 1) % 10 == 0:
-            print(f"  Downloaded {i + 1}/{len(tests)} tests...")
+    # Fetch files concurrently; results come back in submission order
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+        results = executor.map(lambda d: download_file(d[1], d[2]), downloads)
+        for i, ((label, _, _), ok) in enumerate(zip(downloads, results)):
+            if not ok:
+                failed_downloads.append(label)
+
+            # Progress indicator
+            if (i + 1) % 30 == 0:
+                print(f"  Downloaded {i + 1}/{len(downloads)} files...")
 
     # Create a summary file
     summary = {
@@ -367,8 +652,7 @@ def download_test_suite() -> Dict[str, Any]:
     }
 
     summary_path = TEST_SUITE_DIR / "test_summary.json"
-    with open(summary_path, "w") as f:
-        json.dump(summary, f, indent=2)
+    _write_json(summary_path, summary)
     print(f"\nSaved test summary to {summary_path}")
 
     return {
@@ -389,8 +673,7 @@ def load_test_summary() -> Optional[Dict[str, Any]]:
     """Load the test summary if it exists."""
     summary_path = TEST_SUITE_DIR / "test_summary.json"
     if summary_path.exists():
-        with open(summary_path, "r") as f:
-            return json.load(f)
+        return _loads(summary_path.read_bytes())
     return None
 
 
@@ -400,11 +683,68 @@ def is_test_suite_downloaded() -> bool:
     return summary_path.exists()
 
 
+def load_manifest_graph() -> Optional["Graph"]:
+    """
+    Load the downloaded manifest into an rdflib graph.
+
+    The N-Quads form is derived from the manifest once and reused, as rdflib
+    parses it much faster than JSON-LD. The parsed graph is kept in memory
+    until the manifest changes, so repeated queries do not reparse it.
+
+    Returns:
+        The manifest graph, or None if the test suite has not been downloaded
+    """
+    manifest_path = TEST_SUITE_DIR / "frame-manifest.jsonld"
+    if not manifest_path.exists():
+        return None
+
+    nquads_path = TEST_SUITE_DIR / "frame-manifest.nq"
+    manifest_mtime = manifest_path.stat().st_mtime
+    cache_key = (str(manifest_path), manifest_mtime)
+    if cache_key in _GRAPH_CACHE:
+        return _GRAPH_CACHE[cache_key]
+
+    if not nquads_path.exists() or nquads_path.stat().st_mtime < manifest_mtime:
+        manifest_doc = _loads(manifest_path.read_bytes())
+        nquads_path.write_text(
+            manifest_to_nquads(FRAME_MANIFEST_URL, manifest_doc), encoding="utf-8"
+        )
+    from rdflib import Graph
+
+    g = Graph()
+    g.parse(nquads_path, format="nquads")
+
+    _GRAPH_CACHE.clear()
+    _GRAPH_CACHE[cache_key] = g
+    return g
+
+
+def query_positive_tests(g: "Graph") -> List[Dict[str, Any]]:
+    """
+    List the positive evaluation tests in a manifest graph with their names.
+
+    This matches triples directly, which is much faster than running the
+    equivalent SPARQL query through query_manifest_sparql().
+
+    Returns:
+        A {"test": ..., "name": ...} dict per test, like the SPARQL results
+    """
+    from rdflib import RDF, URIRef
+
+    name = URIRef(MF_NAME)
+    return [
+        {"test": test, "name": g.value(test, name)}
+        for test in g.subjects(RDF.type, URIRef(JLD_POSITIVE_TEST))
+    ]
+
+
 def query_manifest_sparql(sparql_query: str) -> Optional[List[Dict[str, Any]]]:
     """
     Query the downloaded manifest using SPARQL.
 
-    This demonstrates how rdflib can be used for more complex queries.
+    This demonstrates how rdflib can be used for more complex queries. For
+    simple lookups, matching triples on load_manifest_graph() directly (as
+    query_positive_tests() does) avoids the SPARQL parsing and planning cost.
 
     Example:
         # Get all positive evaluation tests
@@ -417,13 +757,10 @@ def query_manifest_sparql(sparql_query: str) -> Optional[List[Dict[str, Any]]]:
             }
         ''')
     """
-    manifest_path = TEST_SUITE_DIR / "frame-manifest.jsonld"
-    if not manifest_path.exists():
-        return None
-
     try:
-        g = Graph()
-        g.parse(manifest_path, format="json-ld", base=FRAME_MANIFEST_URL)
+        g = load_manifest_graph()
+        if g is None:
+            return None
         results = g.query(sparql_query)
         return [dict(row.asdict()) for row in results]
     except Exception as e:
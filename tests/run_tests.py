@@ -12,14 +12,31 @@ Usage:
 """
 
 import argparse
+import contextlib
+import io
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 
-def main():
+# Rule printed above and below each step banner
+_SEPARATOR = "=" * 70
+
+
+def _print_banner(title: str, first: bool = False) -> None:
+    """Print a step banner, preceded by a blank line unless it comes first."""
+    prefix = "" if first else "\n"
+    sys.stdout.write(f"{prefix}{_SEPARATOR}\n{title}\n{_SEPARATOR}\n")
+
+
+@lru_cache(maxsize=None)
+def _get_parser() -> argparse.ArgumentParser:
+    """Build the argument parser, once per process (as in the CLI)."""
     parser = argparse.ArgumentParser(description="Run jsonldframe2schema tests")
     parser.add_argument(
         "--download-only",
@@ -37,14 +54,51 @@ def main():
         help="Only run integration tests (skip unit tests)",
     )
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
+    return parser
+
+
+def _run_unit_tests() -> bool:
+    """Run the unit tests against the predefined expected schemas."""
+    try:
+        from tests.test_converter import run_tests_verbose
+
+        return run_tests_verbose()
+    except ImportError as e:
+        print(f"❌ Failed to import unit tests: {e}")
+        print("Make sure 'deepdiff' is installed: pip install deepdiff")
+        return False
+
+
+def _run_integration_tests() -> bool:
+    """Run the integration tests against the W3C test suite frames."""
+    try:
+        from tests.test_w3c_integration import run_integration_tests
+
+        return run_integration_tests()
+    except ImportError as e:
+        print(f"❌ Failed to import integration tests: {e}")
+        return False
 
-    args = parser.parse_args()
 
-    # Download test suite
-    if args.download_only or args.integration_only or not args.unit_only:
-        print("=" * 70)
-        print("Step 1: Checking W3C JSON-LD Frame Test Suite")
-        print("=" * 70)
+def _run_captured(run: Callable[[], bool]) -> Tuple[bool, str]:
+    """
+    Run a test phase, capturing everything it writes to stdout and stderr.
+
+    Returns:
+        Tuple of (passed, output)
+    """
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        passed = run()
+    return passed, output.getvalue()
+
+
+def main():
+    args = _get_parser().parse_args()
+
+    # Download test suite, unless only unit tests (which don't use it) will run
+    if args.download_only or not args.unit_only:
+        _print_banner("Step 1: Checking W3C JSON-LD Frame Test Suite", first=True)
 
         from tests.download_test_suite import (
             download_test_suite,
@@ -66,41 +120,31 @@ def main():
     if args.download_only:
         return 0
 
-    results = {"unit": None, "integration": None}
-
-    # Run unit tests
+    results: Dict[str, Optional[bool]] = {"unit": None, "integration": None}
+    phases = []
     if not args.integration_only:
-        print("\n" + "=" * 70)
-        print("Step 2: Running Unit Tests")
-        print("=" * 70)
-
-        try:
-            from tests.test_converter import run_tests_verbose
-
-            results["unit"] = run_tests_verbose()
-        except ImportError as e:
-            print(f"❌ Failed to import unit tests: {e}")
-            print("Make sure 'deepdiff' is installed: pip install deepdiff")
-            results["unit"] = False
-
-    # Run integration tests
+        phases.append(("unit", "Step 2: Running Unit Tests", _run_unit_tests))
     if not args.unit_only:
-        print("\n" + "=" * 70)
-        print("Step 3: Running Integration Tests")
-        print("=" * 70)
-
-        try:
-            from tests.test_w3c_integration import run_integration_tests
+        phases.append(
+            ("integration", "Step 3: Running Integration Tests", _run_integration_tests)
+        )
 
-            results["integration"] = run_integration_tests()
-        except ImportError as e:
-            print(f"❌ Failed to import integration tests: {e}")
-            results["integration"] = False
+    if len(phases) > 1:
+        # The phases share no state, so run them side by side in separate
+        # processes, then print each one's output in order
+        with ProcessPoolExecutor(max_workers=len(phases)) as executor:
+            futures = [executor.submit(_run_captured, run) for _, _, run in phases]
+            for (key, title, _), future in zip(phases, futures):
+                _print_banner(title)
+                results[key], output = future.result()
+                sys.stdout.write(output)
+    else:
+        for key, title, run in phases:
+            _print_banner(title)
+            results[key] = run()
 
     # Summary
-    print("\n" + "=" * 70)
-    print("Final Summary")
-    print("=" * 70)
+    _print_banner("Final Summary")
 
     all_passed = True
 
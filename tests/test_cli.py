@@ -0,0 +1,224 @@
+"""
+Tests for the jsonldframe2schema command-line interface.
+
+These tests call ``cli.main`` in-process with explicit argv lists, using
+pytest's ``tmp_path`` and ``capsys`` fixtures for file and stream I/O.
+"""
+
+import io
+import json
+import logging
+import sys
+from unittest import mock
+
+import pytest
+
+from jsonldframe2schema import cli, frame_to_schema
+
+PERSON_FRAME = {
+    "@context": {
+        "xsd": "http://www.w3.org/2001/XMLSchema#",
+        "name": "http://schema.org/name",
+        "age": {"@id": "http://schema.org/age", "@type": "xsd:integer"},
+    },
+    "@type": "Person",
+    "name": {},
+    "age": {},
+}
+
+NON_ASCII_FRAME = {"@type": "Café", "名前": {}}
+
+# Numbers that orjson would parse or format differently from json
+NUMERIC_FRAME_TEXT = (
+    '{"@type": "T", "big": 12345678901234567890123, "large": 1e16,'
+    ' "nan": NaN, "inf": -Infinity}'
+)
+
+
+@pytest.fixture
+def frame_file(tmp_path):
+    """Fixture providing a frame file on disk."""
+    path = tmp_path / "frame.json"
+    path.write_text(json.dumps(PERSON_FRAME), encoding="utf-8")
+    return path
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request):
+    """Run a test with and without orjson available."""
+    if request.param == "orjson":
+        if cli.orjson is None:
+            pytest.skip("orjson is not installed")
+        yield request.param
+    else:
+        with mock.patch.object(cli, "orjson", None):
+            yield request.param
+
+
+class TestFileConversion:
+    """Tests for converting frames read from files."""
+
+    def test_file_to_stdout(self, frame_file, capsys, json_backend):
+        """Test converting a frame file prints the schema to stdout."""
+        assert cli.main([str(frame_file)]) == 0
+
+        out = capsys.readouterr().out
+        assert json.loads(out) == frame_to_schema(PERSON_FRAME)
+
+    def test_file_to_file(self, frame_file, tmp_path, caplog, json_backend):
+        """Test converting a frame file writes the schema to a file."""
+        output = tmp_path / "schema.json"
+        with caplog.at_level(logging.INFO, logger=cli.logger.name):
+            assert cli.main([str(frame_file), str(output)]) == 0
+
+        assert f"Schema written to {output}" in caplog.messages
+
+        content = output.read_text(encoding="utf-8")
+        assert content.endswith("\n")
+        assert json.loads(content) == frame_to_schema(PERSON_FRAME)
+
+    def test_schema_version_option(self, frame_file, capsys):
+        """Test a custom --schema-version is used in the output."""
+        version = "https://json-schema.org/draft/2019-09/schema"
+        assert cli.main([str(frame_file), "--schema-version", version]) == 0
+
+        assert json.loads(capsys.readouterr().out)["$schema"] == version
+
+    @pytest.mark.parametrize("indent", ["0", "2", "4"])
+    def test_indent_option(self, frame_file, capsys, json_backend, indent):
+        """Test every indentation produces the same pretty-printed text."""
+        assert cli.main([str(frame_file), "--indent", indent]) == 0
+
+        expected = json.dumps(frame_to_schema(PERSON_FRAME), indent=int(indent))
+        assert capsys.readouterr().out == expected + "\n"
+
+    def test_compact_option(self, frame_file, capsys, json_backend):
+        """Test --compact output is a single line."""
+        assert cli.main([str(frame_file), "--compact"]) == 0
+
+        out = capsys.readouterr().out
+        assert out.count("\n") == 1
+        assert out == json.dumps(frame_to_schema(PERSON_FRAME)) + "\n"
+
+    @pytest.mark.parametrize("options", [[], ["--compact"]])
+    def test_non_ascii_output(self, tmp_path, capsys, json_backend, options):
+        """Test non-ASCII values are escaped exactly as json.dumps does."""
+        frame_file = tmp_path / "café.json"
+        frame_file.write_text(json.dumps(NON_ASCII_FRAME), encoding="utf-8")
+        output = tmp_path / "schema.json"
+        indent = None if options else 2
+        expected = json.dumps(frame_to_schema(NON_ASCII_FRAME), indent=indent) + "\n"
+
+        assert cli.main([str(frame_file)] + options) == 0
+        assert capsys.readouterr().out == expected
+
+        assert cli.main([str(frame_file), str(output)] + options) == 0
+        assert output.read_bytes() == expected.encode("ascii")
+
+    def test_numeric_values(self, tmp_path, capsys, json_backend):
+        """Test big integers, floats and NaN round-trip exactly as with json."""
+        frame_file = tmp_path / "numbers.json"
+        frame_file.write_text(NUMERIC_FRAME_TEXT, encoding="utf-8")
+        schema = frame_to_schema(json.loads(NUMERIC_FRAME_TEXT))
+
+        assert cli.main([str(frame_file)]) == 0
+
+        out = capsys.readouterr().out
+        assert out == json.dumps(schema, indent=2) + "\n"
+        assert '"type": "integer"' in out
+        assert "12345678901234567890123" in out
+        assert "1e+16" in out
+
+
+class TestStdinConversion:
+    """Tests for converting frames piped through stdin."""
+
+    def test_stdin_to_stdout(self, capsys, json_backend):
+        """Test a frame read from stdin is converted to stdout."""
+        stdin = io.TextIOWrapper(io.BytesIO(json.dumps(PERSON_FRAME).encode("utf-8")))
+        with mock.patch.object(sys, "stdin", stdin):
+            assert cli.main([]) == 0
+
+        out = capsys.readouterr().out
+        assert json.loads(out) == frame_to_schema(PERSON_FRAME)
+
+
+class TestBatchConversion:
+    """Tests for converting a directory of frames with --batch."""
+
+    @pytest.fixture
+    def frames_dir(self, tmp_path):
+        """Fixture providing a directory of frame files."""
+        frames = tmp_path / "frames"
+        frames.mkdir()
+        (frames / "person.json").write_text(json.dumps(PERSON_FRAME), encoding="utf-8")
+        (frames / "article.json").write_text(
+            json.dumps({"@type": "Article", "title": {}}), encoding="utf-8"
+        )
+        (frames / "notes.txt").write_text("not a frame", encoding="utf-8")
+        return frames
+
+    def test_converts_every_json_file(self, frames_dir, tmp_path):
+        """Test each *.json frame gets a schema with the same file name."""
+        schemas = tmp_path / "schemas"
+        assert cli.main(["--batch", str(frames_dir), str(schemas)]) == 0
+
+        assert sorted(p.name for p in schemas.iterdir()) == [
+            "article.json",
+            "person.json",
+        ]
+        person_schema = json.loads((schemas / "person.json").read_text())
+        assert person_schema == frame_to_schema(PERSON_FRAME)
+
+    def test_options_apply_to_every_file(self, frames_dir, tmp_path):
+        """Test conversion options are passed through in batch mode."""
+        schemas = tmp_path / "schemas"
+        argv = ["--batch", str(frames_dir), str(schemas), "--graph-only"]
+        assert cli.main(argv) == 0
+
+        for schema_file in schemas.iterdir():
+            assert "@graph" not in json.loads(schema_file.read_text())["properties"]
+
+    def test_invalid_frame_is_reported(self, frames_dir, tmp_path, capsys):
+        """Test one bad frame fails the run without stopping the others."""
+        (frames_dir / "broken.json").write_text("{not json", encoding="utf-8")
+        schemas = tmp_path / "schemas"
+
+        assert cli.main(["--batch", str(frames_dir), str(schemas)]) == 1
+        assert "broken.json: Invalid JSON" in capsys.readouterr().err
+        assert (schemas / "person.json").exists()
+
+    def test_output_path_is_a_file(self, frames_dir, tmp_path, capsys):
+        """Test an output directory that cannot be created is reported."""
+        schemas = tmp_path / "schemas"
+        schemas.write_text("", encoding="utf-8")
+
+        assert cli.main(["--batch", str(frames_dir), str(schemas)]) == 1
+        assert capsys.readouterr().err.startswith(f"Error: {schemas}: ")
+
+    def test_requires_output_directory(self, frames_dir):
+        """Test --batch without an output directory is a usage error."""
+        with pytest.raises(SystemExit):
+            cli.main(["--batch", str(frames_dir)])
+
+    def test_refuses_to_overwrite_frames(self, frames_dir, capsys):
+        """Test the output directory cannot be the batch directory."""
+        assert cli.main(["--batch", str(frames_dir), str(frames_dir)]) == 1
+        assert "must differ" in capsys.readouterr().err
+
+
+class TestErrors:
+    """Tests for CLI error handling."""
+
+    def test_missing_file(self, tmp_path, capsys):
+        """Test a missing input file is reported and returns 1."""
+        assert cli.main([str(tmp_path / "missing.json")]) == 1
+        assert "File not found" in capsys.readouterr().err
+
+    def test_invalid_json(self, tmp_path, capsys, json_backend):
+        """Test invalid JSON input is reported and returns 1."""
+        path = tmp_path / "broken.json"
+        path.write_text("{not json", encoding="utf-8")
+
+        assert cli.main([str(path)]) == 1
+        assert "Invalid JSON" in capsys.readouterr().err
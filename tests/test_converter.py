@@ -16,9 +16,14 @@ Usage:
 
 import sys
 import unittest
+import unittest.mock
 from typing import Dict
 
-from jsonldframe2schema import frame_to_schema, FrameToSchemaConverter
+from jsonldframe2schema import (
+    frame_to_schema,
+    frame_to_schema_cached,
+    FrameToSchemaConverter,
+)
 from tests.expected_schemas import get_all_test_cases, get_test_case_by_id
 from tests.conftest import compare_schemas
 
@@ -238,6 +243,230 @@ class TestConverterClass(unittest.TestCase):
                 f"Missing type mapping for {xsd_type}",
             )
 
+    def test_literal_subclasses_infer_json_type(self):
+        """Test literals of builtin subclasses map like their base types."""
+
+        class Count(int):
+            pass
+
+        schema = frame_to_schema(
+            {"flag": True, "count": Count(3), "ratio": 0.5}, graph_only=True
+        )
+
+        self.assertEqual(schema["properties"]["flag"]["type"], "boolean")
+        self.assertEqual(schema["properties"]["count"]["type"], "integer")
+        self.assertEqual(schema["properties"]["ratio"]["type"], "number")
+
+    def test_type_mappings_are_flat(self):
+        """Test type mappings hold only primitives, so shallow copies suffice."""
+        for type_uri, mapping in FrameToSchemaConverter.TYPE_MAPPINGS.items():
+            for value in mapping.values():
+                self.assertIsInstance(
+                    value,
+                    (str, int, float, bool),
+                    f"Nested value in type mapping for {type_uri}",
+                )
+
+    def test_type_mapping_results_are_independent(self):
+        """Test mutating a generated schema does not change TYPE_MAPPINGS."""
+        frame = {
+            "@context": {
+                "xsd": "http://www.w3.org/2001/XMLSchema#",
+                "@vocab": "http://schema.org/",
+                "when": {"@type": "xsd:dateTime"},
+            },
+            "when": {},
+        }
+        schema = frame_to_schema(frame, graph_only=True)
+        schema["properties"]["when"]["format"] = "changed"
+
+        self.assertEqual(
+            FrameToSchemaConverter.TYPE_MAPPINGS[
+                "http://www.w3.org/2001/XMLSchema#dateTime"
+            ],
+            {"type": "string", "format": "date-time"},
+        )
+
+
+class TestCachedConversion(unittest.TestCase):
+    """Tests for the memoizing frame_to_schema_cached wrapper."""
+
+    def test_matches_uncached_conversion(self):
+        """Test cached conversion produces the same schema for every case."""
+        for tc in get_all_test_cases():
+            with self.subTest(test_id=tc["id"]):
+                self.assertEqual(
+                    frame_to_schema_cached(tc["frame"]), frame_to_schema(tc["frame"])
+                )
+
+    def test_repeated_frame_is_not_reconverted(self):
+        """Test an identical frame is served from the cache."""
+        frame = {"@type": "CachedThing", "name": {}}
+        frame_to_schema_cached(frame)
+
+        with unittest.mock.patch(
+            "jsonldframe2schema.converter.frame_to_schema"
+        ) as mock_convert:
+            frame_to_schema_cached({"@type": "CachedThing", "name": {}})
+            mock_convert.assert_not_called()
+
+    def test_options_are_part_of_cache_key(self):
+        """Test schema_version and graph_only produce distinct results."""
+        frame = {"@type": "Person", "name": {}}
+        custom_version = "https://json-schema.org/draft/2019-09/schema"
+
+        full = frame_to_schema_cached(frame)
+        custom = frame_to_schema_cached(frame, schema_version=custom_version)
+        graph_only = frame_to_schema_cached(frame, graph_only=True)
+
+        self.assertEqual(custom["$schema"], custom_version)
+        self.assertIn("@graph", full["properties"])
+        self.assertNotIn("@graph", graph_only["properties"])
+
+    def test_result_mutation_does_not_leak(self):
+        """Test mutating a returned schema does not affect later calls."""
+        frame = {"@type": "Person", "name": {}}
+        first = frame_to_schema_cached(frame)
+        first["properties"].clear()
+
+        second = frame_to_schema_cached(frame)
+        self.assertIn("@graph", second["properties"])
+
+
+class TestContextCache(unittest.TestCase):
+    """Tests for reuse of parsed @context information across conversions."""
+
+    CONTEXT = {
+        "xsd": "http://www.w3.org/2001/XMLSchema#",
+        "cachedAge": {"@id": "http://schema.org/age", "@type": "xsd:integer"},
+    }
+
+    def test_shared_context_is_expanded_once(self):
+        """Test frames with an identical context reuse the parsed context."""
+        frame = {"@context": self.CONTEXT, "cachedAge": {}}
+        frame_to_schema(frame)
+
+        with unittest.mock.patch(
+            "jsonldframe2schema.converter.jsonld.expand"
+        ) as mock_expand:
+            schema = frame_to_schema(
+                {"@context": dict(self.CONTEXT), "cachedAge": {}}, graph_only=True
+            )
+            mock_expand.assert_not_called()
+
+        self.assertEqual(schema["properties"]["cachedAge"], {"type": "integer"})
+
+    def test_subclasses_do_not_share_parsed_contexts(self):
+        """Test the context cache is per class and never calls __init__."""
+
+        class RequiredArgConverter(FrameToSchemaConverter):
+            def __init__(self, label):
+                super().__init__(graph_only=True)
+                self.label = label
+
+        class UntypedConverter(RequiredArgConverter):
+            @classmethod
+            def _parse_context(cls, context):
+                return {}
+
+        frame = {"@context": self.CONTEXT, "cachedAge": {}}
+        base = RequiredArgConverter("base").convert(frame)
+        untyped = UntypedConverter("untyped").convert(frame)
+
+        self.assertEqual(base["properties"]["cachedAge"], {"type": "integer"})
+        self.assertEqual(untyped["properties"]["cachedAge"], {"type": "string"})
+        self.assertEqual(
+            RequiredArgConverter("again").convert(frame)["properties"]["cachedAge"],
+            {"type": "integer"},
+        )
+
+    def test_typed_terms_are_expanded_together(self):
+        """Test all type-coerced terms in a context share one expand() call."""
+        from pyld import jsonld
+
+        frame = {
+            "@context": {
+                "xsd": "http://www.w3.org/2001/XMLSchema#",
+                "@vocab": "http://example.org/batch/",
+                "count": {"@type": "xsd:integer"},
+                "ratio": {"@type": "xsd:double"},
+                "born": {"@type": "xsd:date"},
+            },
+            "count": {},
+            "ratio": {},
+            "born": {},
+        }
+
+        with unittest.mock.patch(
+            "jsonldframe2schema.converter.jsonld.expand", wraps=jsonld.expand
+        ) as mock_expand:
+            schema = frame_to_schema(frame, graph_only=True)
+
+        self.assertEqual(mock_expand.call_count, 1)
+        self.assertEqual(
+            schema["properties"],
+            {
+                "count": {"type": "integer"},
+                "ratio": {"type": "number"},
+                "born": {"type": "string", "format": "date"},
+            },
+        )
+
+    def test_array_context_is_expanded_together(self):
+        """Test array context entries share one expand() call and prefixes."""
+        from pyld import jsonld
+
+        frame = {
+            "@context": [
+                {"xsd": "http://www.w3.org/2001/XMLSchema#"},
+                {"listCount": {"@id": "http://example.org/c", "@type": "xsd:integer"}},
+                {"listRatio": {"@id": "http://example.org/r", "@type": "xsd:double"}},
+            ],
+            "listCount": {},
+            "listRatio": {},
+        }
+
+        with unittest.mock.patch(
+            "jsonldframe2schema.converter.jsonld.expand", wraps=jsonld.expand
+        ) as mock_expand:
+            schema = frame_to_schema(frame, graph_only=True)
+
+        self.assertEqual(mock_expand.call_count, 1)
+        self.assertEqual(
+            schema["properties"],
+            {"listCount": {"type": "integer"}, "listRatio": {"type": "number"}},
+        )
+
+    def test_array_context_bad_term_keeps_other_entries(self):
+        """Test an invalid term in one array entry keeps the other entries' types."""
+        frame = {
+            "@context": [
+                {
+                    "xsd": "http://www.w3.org/2001/XMLSchema#",
+                    "isolatedAge": {"@id": "http://s/age", "@type": "xsd:integer"},
+                },
+                {"lst": {"@container": "@list", "@type": "xsd:double"}},
+                {
+                    "isolatedRatio": {
+                        "@id": "http://s/ratio",
+                        "@type": "http://www.w3.org/2001/XMLSchema#double",
+                    }
+                },
+            ],
+            "isolatedAge": {},
+            "isolatedRatio": {},
+        }
+
+        for convert in (frame_to_schema, frame_to_schema_cached):
+            schema = convert(frame, graph_only=True)
+            self.assertEqual(
+                schema["properties"],
+                {
+                    "isolatedAge": {"type": "integer"},
+                    "isolatedRatio": {"type": "number"},
+                },
+            )
+
 
 class TestEdgeCases(unittest.TestCase):
     """Tests for edge cases and unusual inputs."""
@@ -249,6 +478,48 @@ class TestEdgeCases(unittest.TestCase):
         self.assertEqual(schema["type"], "object")
         self.assertTrue(schema["additionalProperties"])
 
+    def test_context_only_frame_skips_context_parsing(self):
+        """Test a frame with nothing to constrain never expands its context."""
+        frame = {
+            "@context": {
+                "xsd": "http://www.w3.org/2001/XMLSchema#",
+                "unparsedAge": {"@type": "xsd:integer"},
+            }
+        }
+        with unittest.mock.patch(
+            "jsonldframe2schema.converter.jsonld.expand"
+        ) as mock_expand:
+            schema = frame_to_schema(frame, graph_only=True)
+            mock_expand.assert_not_called()
+
+        self.assertEqual(schema, frame_to_schema({}, graph_only=True))
+
+    def test_graph_item_uses_outer_context(self):
+        """Test a @graph item without @context uses the outer frame's context."""
+        frame = {
+            "@context": {
+                "xsd": "http://www.w3.org/2001/XMLSchema#",
+                "age": {"@id": "http://schema.org/age", "@type": "xsd:integer"},
+            },
+            "@graph": [{"@type": "Person", "age": {}}],
+        }
+        schema = frame_to_schema(frame, graph_only=True)
+
+        self.assertEqual(schema["properties"]["age"], {"type": "integer"})
+        self.assertNotIn("@context", frame["@graph"][0])
+
+    def test_nested_flag_override_does_not_leak(self):
+        """Test a flag overridden in one nested frame leaves siblings unchanged."""
+        frame = {
+            "@explicit": True,
+            "open": {"@explicit": False, "a": {}},
+            "closed": {"b": {}},
+        }
+        props = frame_to_schema(frame, graph_only=True)["properties"]
+
+        self.assertTrue(props["open"]["additionalProperties"])
+        self.assertFalse(props["closed"]["additionalProperties"])
+
     def test_deeply_nested_frame(self):
         """Test deeply nested frame structure."""
         frame = {
@@ -530,6 +801,8 @@ def run_tests_verbose():
     suite.addTests(loader.loadTestsFromTestCase(TestFrameToSchemaMapping))
     suite.addTests(loader.loadTestsFromTestCase(TestSchemaValidity))
     suite.addTests(loader.loadTestsFromTestCase(TestConverterClass))
+    suite.addTests(loader.loadTestsFromTestCase(TestCachedConversion))
+    suite.addTests(loader.loadTestsFromTestCase(TestContextCache))
     suite.addTests(loader.loadTestsFromTestCase(TestEdgeCases))
 
     # Run with verbosity